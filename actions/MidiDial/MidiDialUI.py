@@ -0,0 +1,461 @@
+"""
+MidiDialUI - Config panel for the MIDI Dial Control action.
+
+Imported on first use from MidiDial.get_config_rows, so loading the plugin
+does not require GTK.
+"""
+import gi
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Gtk, Adw
+
+from ...internal.ConfigModels import ConfigModels
+
+# Import GtkHelper for ComboRow
+try:
+    from GtkHelper.GtkHelper import ComboRow
+except ImportError:
+    print("Failed to import GtkHelper. Using fallback or failing.")
+    ComboRow = None
+
+
+class MidiDialConfigUI:
+    """Builds the config rows for a MidiDial action and writes changes back to it."""
+
+    def __init__(self, action):
+        self.action = action
+
+    def get_config_rows(self) -> list:
+        """Return configuration rows for the action."""
+        if ComboRow is None:
+            return []
+
+        settings = self.action.get_settings()
+        rows = []
+
+        # -- Port Selection --
+        # Port model shared by all panels, see ConfigModels
+        self._refresh_port_list()
+        
+        self.port_row = ComboRow(title=self.action._lm("config.port"), model=self.port_choices.store)
+        
+        renderer = Gtk.CellRendererText()
+        self.port_row.combo_box.pack_start(renderer, True)
+        self.port_row.combo_box.add_attribute(renderer, "text", 0)
+        
+        current_port = settings.get("port", "")
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+        self.port_row.combo_box.connect("changed", self._on_port_changed)
+        rows.append(self.port_row)
+
+        # -- Refresh Ports Button --
+        refresh_row = Adw.ActionRow()
+        refresh_row.set_title(self.action._lm("config.port.refresh"))
+        refresh_button = Gtk.Button()
+        refresh_button.set_icon_name("view-refresh-symbolic")
+        refresh_button.set_valign(Gtk.Align.CENTER)
+        refresh_button.connect("clicked", self._on_refresh_ports)
+        refresh_row.add_suffix(refresh_button)
+        rows.append(refresh_row)
+
+        # -- Channel --
+        self.channel_row = Adw.SpinRow.new_with_range(0, 15, 1)
+        self.channel_row.set_title(self.action._lm("config.channel"))
+        self.channel_row.set_subtitle(self.action._lm("config.channel.subtitle"))
+        self.channel_row.set_value(settings.get("channel", 0))
+        self.channel_row.connect("notify::value", self._on_channel_changed)
+        rows.append(self.channel_row)
+
+        # -- CC Number Selection --
+        self.cc_choices = self._cc_choices_for(settings.get("resolution", "7bit"))
+
+        self.cc_row = ComboRow(title=self.action._lm("config.cc_number"), model=self.cc_choices.store)
+        cc_renderer = Gtk.CellRendererText()
+        self.cc_row.combo_box.pack_start(cc_renderer, True)
+        self.cc_row.combo_box.add_attribute(cc_renderer, "text", 0)
+        
+        current_cc = settings.get("cc_number", 7)
+        cc_active_index = self.cc_choices.index_of(current_cc)
+        self.cc_row.combo_box.set_active(cc_active_index)
+        self.cc_row.combo_box.connect("changed", self._on_cc_changed)
+        rows.append(self.cc_row)
+
+        # -- Resolution --
+        self.resolution_choices = ConfigModels.choices("midi_dial.resolution", self.action, lambda: [
+            (self.action._lm("config.resolution.7bit"), "7bit"),
+            (self.action._lm("config.resolution.14bit"), "14bit"),
+            (self.action._lm("config.resolution.nrpn"), "nrpn"),
+            (self.action._lm("config.resolution.rpn"), "rpn"),
+        ])
+
+        self.resolution_row = ComboRow(title=self.action._lm("config.resolution"), model=self.resolution_choices.store)
+        resolution_renderer = Gtk.CellRendererText()
+        self.resolution_row.combo_box.pack_start(resolution_renderer, True)
+        self.resolution_row.combo_box.add_attribute(resolution_renderer, "text", 0)
+
+        current_resolution = settings.get("resolution", "7bit")
+        resolution_active_index = self.resolution_choices.index_of(current_resolution)
+        self.resolution_row.combo_box.set_active(resolution_active_index)
+        self.resolution_row.combo_box.connect("changed", self._on_resolution_changed)
+        rows.append(self.resolution_row)
+
+        # -- NRPN/RPN Parameter Number --
+        self.param_row = Adw.SpinRow.new_with_range(0, self.action.MAX_VALUE_14BIT, 1)
+        self.param_row.set_title(self.action._lm("config.param_number"))
+        self.param_row.set_subtitle(self.action._lm("config.param_number.subtitle"))
+        self.param_row.set_value(settings.get("param_number", 0))
+        self.param_row.connect("notify::value", self._on_param_number_changed)
+        rows.append(self.param_row)
+
+        # -- Step Size --
+        self.step_row = Adw.SpinRow.new_with_range(1, 32, 1)
+        self.step_row.set_title(self.action._lm("config.step_size"))
+        self.step_row.set_subtitle(self.action._lm("config.step_size.subtitle"))
+        self.step_row.set_value(settings.get("step_size", 4))
+        self.step_row.connect("notify::value", self._on_step_changed)
+        rows.append(self.step_row)
+
+        # -- Acceleration --
+        self.accel_choices = ConfigModels.choices("midi_dial.acceleration", self.action, lambda: [
+            (self.action._lm("config.acceleration.off"), "off"),
+            (self.action._lm("config.acceleration.linear"), "linear"),
+            (self.action._lm("config.acceleration.quadratic"), "quadratic"),
+        ])
+
+        self.accel_row = ComboRow(title=self.action._lm("config.acceleration"), model=self.accel_choices.store)
+        accel_renderer = Gtk.CellRendererText()
+        self.accel_row.combo_box.pack_start(accel_renderer, True)
+        self.accel_row.combo_box.add_attribute(accel_renderer, "text", 0)
+
+        current_accel = settings.get("acceleration", "off")
+        accel_active_index = self.accel_choices.index_of(current_accel)
+        self.accel_row.combo_box.set_active(accel_active_index)
+        self.accel_row.combo_box.connect("changed", self._on_acceleration_changed)
+        rows.append(self.accel_row)
+
+        self.accel_max_row = Adw.SpinRow.new_with_range(1, 64, 1)
+        self.accel_max_row.set_title(self.action._lm("config.acceleration_max"))
+        self.accel_max_row.set_subtitle(self.action._lm("config.acceleration_max.subtitle"))
+        self.accel_max_row.set_value(settings.get("acceleration_max", 8))
+        self.accel_max_row.connect("notify::value", self._on_acceleration_max_changed)
+        rows.append(self.accel_max_row)
+
+        self.accel_decay_row = Adw.SpinRow.new_with_range(20, 1000, 10)
+        self.accel_decay_row.set_title(self.action._lm("config.acceleration_decay"))
+        self.accel_decay_row.set_subtitle(self.action._lm("config.acceleration_decay.subtitle"))
+        self.accel_decay_row.set_value(settings.get("acceleration_decay_ms", 150))
+        self.accel_decay_row.connect("notify::value", self._on_acceleration_decay_changed)
+        rows.append(self.accel_decay_row)
+
+        accel_enabled = current_accel != "off"
+        self.accel_max_row.set_sensitive(accel_enabled)
+        self.accel_decay_row.set_sensitive(accel_enabled)
+
+        # -- Default Value --
+        self.default_row = Adw.SpinRow.new_with_range(0, 127, 1)
+        self.default_row.set_title(self.action._lm("config.default_value"))
+        self.default_row.set_subtitle(self.action._lm("config.default_value.subtitle"))
+        self.default_row.set_value(settings.get("default_value", 64))
+        self.default_row.connect("notify::value", self._on_default_changed)
+        rows.append(self.default_row)
+
+        # -- Min Value --
+        self.min_row = Adw.SpinRow.new_with_range(0, 127, 1)
+        self.min_row.set_title(self.action._lm("config.min_value"))
+        self.min_row.set_value(settings.get("min_value", 0))
+        self.min_row.connect("notify::value", self._on_min_changed)
+        rows.append(self.min_row)
+
+        # -- Max Value --
+        self.max_row = Adw.SpinRow.new_with_range(0, 127, 1)
+        self.max_row.set_title(self.action._lm("config.max_value"))
+        self.max_row.set_value(settings.get("max_value", 127))
+        self.max_row.connect("notify::value", self._on_max_changed)
+        rows.append(self.max_row)
+
+        # -- Press Action --
+        self.press_choices = ConfigModels.choices("midi_dial.press_action", self.action, lambda: [
+            (self.action._lm("config.press_action.mute"), "mute"),
+            (self.action._lm("config.press_action.reset"), "reset"),
+            (self.action._lm("config.press_action.send"), "send_value"),
+        ])
+        
+        self.press_row = ComboRow(title=self.action._lm("config.press_action"), model=self.press_choices.store)
+        press_renderer = Gtk.CellRendererText()
+        self.press_row.combo_box.pack_start(press_renderer, True)
+        self.press_row.combo_box.add_attribute(press_renderer, "text", 0)
+        
+        current_press = settings.get("press_action", "mute")
+        press_active_index = self.press_choices.index_of(current_press)
+        self.press_row.combo_box.set_active(press_active_index)
+        self.press_row.combo_box.connect("changed", self._on_press_action_changed)
+        rows.append(self.press_row)
+
+        # -- Display Mode --
+        self.display_choices = ConfigModels.choices("midi_dial.display_mode", self.action, lambda: [
+            (self.action._lm("config.display_mode.value"), "value"),
+            (self.action._lm("config.display_mode.percent"), "percent"),
+        ])
+        
+        self.display_row = ComboRow(title=self.action._lm("config.display_mode"), model=self.display_choices.store)
+        display_renderer = Gtk.CellRendererText()
+        self.display_row.combo_box.pack_start(display_renderer, True)
+        self.display_row.combo_box.add_attribute(display_renderer, "text", 0)
+        
+        current_display = settings.get("display_mode", "value")
+        display_active_index = self.display_choices.index_of(current_display)
+        self.display_row.combo_box.set_active(display_active_index)
+        self.display_row.combo_box.connect("changed", self._on_display_changed)
+        rows.append(self.display_row)
+
+        # -- Send on Ready --
+        self.send_ready_row = Adw.SwitchRow()
+        self.send_ready_row.set_title(self.action._lm("config.send_on_ready"))
+        self.send_ready_row.set_subtitle(self.action._lm("config.send_on_ready.subtitle"))
+        self.send_ready_row.set_active(settings.get("send_on_ready", False))
+        self.send_ready_row.connect("notify::active", self._on_send_ready_changed)
+        rows.append(self.send_ready_row)
+
+        # -- Rate Limiting --
+        self.coalesce_row = Adw.SwitchRow()
+        self.coalesce_row.set_title(self.action._lm("config.coalesce_cc"))
+        self.coalesce_row.set_subtitle(self.action._lm("config.coalesce_cc.subtitle"))
+        self.coalesce_row.set_active(settings.get("coalesce_cc", True))
+        self.coalesce_row.connect("notify::active", self._on_coalesce_changed)
+        rows.append(self.coalesce_row)
+
+        self.max_rate_row = Adw.SpinRow.new_with_range(10, 1000, 10)
+        self.max_rate_row.set_title(self.action._lm("config.max_rate"))
+        self.max_rate_row.set_subtitle(self.action._lm("config.max_rate.subtitle"))
+        self.max_rate_row.set_value(settings.get("max_rate", 100))
+        self.max_rate_row.set_sensitive(settings.get("coalesce_cc", True))
+        self.max_rate_row.connect("notify::value", self._on_max_rate_changed)
+        rows.append(self.max_rate_row)
+
+        # -- Persist Delay --
+        self.persist_delay_row = Adw.SpinRow.new_with_range(100, 5000, 100)
+        self.persist_delay_row.set_title(self.action._lm("config.persist_delay"))
+        self.persist_delay_row.set_subtitle(self.action._lm("config.persist_delay.subtitle"))
+        self.persist_delay_row.set_value(settings.get("persist_delay_ms", 500))
+        self.persist_delay_row.connect("notify::value", self._on_persist_delay_changed)
+        rows.append(self.persist_delay_row)
+
+        # -- Display Refresh Rate --
+        self.display_fps_row = Adw.SpinRow.new_with_range(5, 60, 5)
+        self.display_fps_row.set_title(self.action._lm("config.display_fps"))
+        self.display_fps_row.set_subtitle(self.action._lm("config.display_fps.subtitle"))
+        self.display_fps_row.set_value(settings.get("display_fps", 30))
+        self.display_fps_row.connect("notify::value", self._on_display_fps_changed)
+        rows.append(self.display_fps_row)
+
+        self._update_resolution_rows(settings)
+
+        return rows
+
+    def _cc_options(self):
+        """CC combo entries: the common controllers by name, then all others by number."""
+        named = [
+            (self.action._lm("config.cc.volume"), 7),
+            (self.action._lm("config.cc.pan"), 10),
+            (self.action._lm("config.cc.expression"), 11),
+            (self.action._lm("config.cc.modulation"), 1),
+            (self.action._lm("config.cc.sustain"), 64),
+            (self.action._lm("config.cc.reverb"), 91),
+            (self.action._lm("config.cc.chorus"), 93),
+        ]
+        used_ccs = {num for _, num in named}
+        return named + [(f"CC {i}", i) for i in range(128) if i not in used_ccs]
+
+    def _cc_choices_for(self, resolution):
+        """Shared CC model for the resolution; 14-bit pairs only exist for CC 0-31."""
+        if resolution == "14bit":
+            return ConfigModels.choices(
+                "midi_dial.cc_number_14bit", self.action,
+                lambda: [(label, cc) for label, cc in self._cc_options() if cc < 32], value_type=int,
+            )
+        return ConfigModels.choices("midi_dial.cc_number", self.action, self._cc_options, value_type=int)
+
+    def _update_resolution_rows(self, settings):
+        """Show the rows and value ranges that apply to the configured resolution."""
+        resolution = settings.get("resolution", "7bit")
+        full_scale = self.action._full_scale(resolution)
+        self.cc_row.set_visible(resolution in ("7bit", "14bit"))
+        cc_choices = self._cc_choices_for(resolution)
+        if cc_choices is not self.cc_choices:
+            # Switching models selects the stored CC, or the first entry if it
+            # has no 14-bit pair; the changed handler saves the selection
+            self.cc_choices = cc_choices
+            self.cc_row.combo_box.set_model(cc_choices.store)
+            self.cc_row.combo_box.set_active(cc_choices.index_of(settings.get("cc_number", 7)))
+        self.param_row.set_visible(resolution in ("nrpn", "rpn"))
+        # Keep the step size range proportional, e.g. 1-32 becomes 1-4096
+        self.step_row.set_range(1, 32 if full_scale == self.action.MAX_VALUE_7BIT else 32 * 128)
+        for row in (self.default_row, self.min_row, self.max_row):
+            row.set_range(0, full_scale)
+
+    def _refresh_port_list(self, rescan=False):
+        """Point the port row at the shared port model, refreshed from the port directory."""
+        self.port_choices = ConfigModels.ports(
+            self.action._midi_manager, self.action._lm("config.port.no_ports"), rescan=rescan
+        )
+
+    def _on_refresh_ports(self, button):
+        """Handle refresh ports button click."""
+        settings = self.action.get_settings()
+        current_port = settings.get("port", "")
+        
+        self._refresh_port_list(rescan=True)
+        
+        # Try to reselect the current port
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+
+    def _on_port_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            port = model[tree_iter][0]
+            settings = self.action.get_settings()
+            settings["port"] = port
+            self.action._save_config(settings)
+            self.action._watch_port(port)
+
+    def _on_channel_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["channel"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_cc_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            cc_number = model[tree_iter][1]
+            settings = self.action.get_settings()
+            settings["cc_number"] = cc_number
+            self.action._save_config(settings)
+            self.action._update_display()
+
+    def _on_resolution_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if not tree_iter:
+            return
+        settings = self.action.get_settings()
+        old_scale = self.action._full_scale(settings.get("resolution", "7bit"))
+        settings["resolution"] = combo.get_model()[tree_iter][1]
+        new_scale = self.action._full_scale(settings["resolution"])
+        if new_scale != old_scale:
+            # Rescale stored values so the dial keeps its position and range
+            def rescale(value):
+                return round(value * new_scale / old_scale)
+            for key in ("default_value", "min_value", "max_value"):
+                if key in settings:
+                    settings[key] = rescale(settings[key])
+            settings["step_size"] = max(1, round(settings.get("step_size", 4) * new_scale / old_scale))
+            self.action._current_value = rescale(self.action._current_value)
+            self.action._pre_mute_value = rescale(self.action._pre_mute_value)
+            settings["current_value"] = self.action._current_value
+            settings["pre_mute_value"] = self.action._pre_mute_value
+        self.action._save_config(settings)
+        self._update_resolution_rows(settings)
+        # Reflect the rescaled values in the rows (their handlers store the same values again)
+        self.step_row.set_value(settings.get("step_size", 4))
+        self.default_row.set_value(settings.get("default_value", 64))
+        self.min_row.set_value(settings.get("min_value", 0))
+        self.max_row.set_value(settings.get("max_value", new_scale))
+        self.action._update_display()
+
+    def _on_param_number_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["param_number"] = int(widget.get_value())
+        self.action._save_config(settings)
+        self.action._update_display()
+
+    def _on_step_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["step_size"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_acceleration_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            settings = self.action.get_settings()
+            settings["acceleration"] = model[tree_iter][1]
+            self.action._save_config(settings)
+            accel_enabled = settings["acceleration"] != "off"
+            self.accel_max_row.set_sensitive(accel_enabled)
+            self.accel_decay_row.set_sensitive(accel_enabled)
+            self.action._accelerator.reset()
+
+    def _on_acceleration_max_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["acceleration_max"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_acceleration_decay_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["acceleration_decay_ms"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_default_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["default_value"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_min_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["min_value"] = int(widget.get_value())
+        self.action._save_config(settings)
+        self.action._update_display()
+
+    def _on_max_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["max_value"] = int(widget.get_value())
+        self.action._save_config(settings)
+        self.action._update_display()
+
+    def _on_press_action_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            action = model[tree_iter][1]
+            settings = self.action.get_settings()
+            settings["press_action"] = action
+            self.action._save_config(settings)
+
+    def _on_display_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            mode = model[tree_iter][1]
+            settings = self.action.get_settings()
+            settings["display_mode"] = mode
+            self.action._save_config(settings)
+            self.action._update_display()
+
+    def _on_send_ready_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["send_on_ready"] = widget.get_active()
+        self.action._save_config(settings)
+
+    def _on_coalesce_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["coalesce_cc"] = widget.get_active()
+        self.action._save_config(settings)
+        self.max_rate_row.set_sensitive(settings["coalesce_cc"])
+
+    def _on_max_rate_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["max_rate"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_persist_delay_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["persist_delay_ms"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def _on_display_fps_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["display_fps"] = int(widget.get_value())
+        self.action._save_config(settings)
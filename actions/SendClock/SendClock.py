@@ -0,0 +1,86 @@
+from src.backend.PluginManager.ActionBase import ActionBase
+import os
+
+from ...internal.ActionConfig import ConfigMixin, SendClockConfig
+from ...internal.MidiClock import MidiClock
+from ...internal.PortWatch import PortWatchMixin
+
+
+class SendClock(ConfigMixin, PortWatchMixin, ActionBase):
+    _config_class = SendClockConfig
+
+    """
+    Action that starts and stops a 24 PPQN MIDI clock on the selected port.
+
+    The clock runs on its own thread (internal/MidiClock.py) and keeps running
+    when the page changes; the key shows the tempo and the play state. The
+    plugin stops all clocks when the app quits.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Shared MIDI service, initialized once by the plugin
+        self._midi_manager = self.plugin_base.midi_manager
+        # Config panel, created on first get_config_rows
+        self._config_ui = None
+        # Settings snapshot read on key presses, rebuilt by _save_config
+        self._config = SendClockConfig()
+
+    def _lm(self, key: str) -> str:
+        """Get localized string with fallback to key."""
+        try:
+            return self.plugin_base.locale_manager.get(key)
+        except Exception:
+            return key
+
+    def on_ready(self) -> None:
+        self._ensure_default_settings()
+        self._build_config(self.get_settings())
+
+        icon_path = os.path.join(self.plugin_base.PATH, "assets", "midi.png")
+        if os.path.exists(icon_path):
+            self.set_media(media_path=icon_path, size=0.75)
+        self._update_labels()
+        self._watch_port(self._config.port)
+
+    def _get_clock(self):
+        port_name = self._config.port
+        if not port_name:
+            return None
+        return MidiClock.for_port(port_name)
+
+    def _update_labels(self):
+        clock = self._get_clock()
+        running = clock is not None and clock.running
+        self.set_top_label("CLOCK", font_size=12)
+        self.set_center_label(str(self._config.bpm), font_size=20)
+        self.set_bottom_label("PLAY" if running else "STOP", font_size=12)
+
+    def on_key_down(self) -> None:
+        clock = self._get_clock()
+        if clock is None:
+            self.show_error(duration=1)
+            return
+
+        if clock.running:
+            clock.stop()
+            stats = clock.get_stats()["lateness"]
+            print(f"MIDI clock on {clock.port_name} stopped: {stats['count']} ticks, "
+                  f"lateness p99 {stats['p99_us']:.0f} us, max {stats['max_us']:.0f} us")
+        else:
+            config = self._config
+            clock.reset_stats()
+            clock.start(bpm=config.bpm, resume=config.resume)
+        self._update_labels()
+
+    def get_clock_stats(self):
+        """Return the jitter stats of this action's clock, or None without a port."""
+        clock = self._get_clock()
+        return clock.get_stats() if clock is not None else None
+
+    def get_config_rows(self) -> list:
+        """Return configuration rows for the action."""
+        # GTK is only imported once a config panel is opened
+        from .SendClockUI import SendClockConfigUI
+        self._config_ui = SendClockConfigUI(self)
+        return self._config_ui.get_config_rows()
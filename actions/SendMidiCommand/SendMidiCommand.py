@@ -1,35 +1,25 @@
 from src.backend.PluginManager.ActionBase import ActionBase
-import sys
+from functools import partial
 import os
 
-import gi
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, Gdk, GLib
+from ...internal.ActionConfig import ConfigMixin, SendMidiCommandConfig
+from ...internal.PortWatch import PortWatchMixin
 
-# Import GtkHelper for ComboRow
-try:
-    from GtkHelper.GtkHelper import ComboRow
-except ImportError:
-    print("Failed to import GtkHelper. Using fallback or failing.")
-    ComboRow = None
 
-class SendMidiCommand(ActionBase):
+class SendMidiCommand(ConfigMixin, PortWatchMixin, ActionBase):
+    _config_class = SendMidiCommandConfig
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._midi_manager = None
-        self._load_midi_manager()
-
-    def _load_midi_manager(self):
-        try:
-            plugin_path = self.plugin_base.PATH
-            if plugin_path not in sys.path:
-                sys.path.insert(0, plugin_path)
-            from internal.MidiManager import MidiManager
-            self._midi_manager = MidiManager
-        except Exception as e:
-            print(f"Failed to load MidiManager: {e}")
-            self._midi_manager = None
+        # Shared MIDI service, initialized once by the plugin
+        self._midi_manager = self.plugin_base.midi_manager
+        # Config panel, created on first get_config_rows
+        self._config_ui = None
+        # Bound senders compiled from the settings, see _compile_senders
+        self._down_sender = self._show_send_error
+        self._up_sender = self._noop
+        # Settings snapshot, rebuilt by _save_config
+        self._config = SendMidiCommandConfig()
 
     def _lm(self, key: str) -> str:
         """Get localized string with fallback to key."""
@@ -41,24 +31,15 @@ class SendMidiCommand(ActionBase):
     def on_ready(self) -> None:
         # Initialize settings with defaults if not set
         self._ensure_default_settings()
+        self._build_config(self.get_settings())
+        self._compile_senders()
         self.update_key_image()
+        self._watch_port(self._config.port)
 
-    def _ensure_default_settings(self):
-        """Ensure settings have default values."""
-        settings = self.get_settings()
-        defaults = {
-            "msg_type": "note_on",
-            "channel": 0,
-            "data1": 60,
-            "data2": 100,
-        }
-        changed = False
-        for key, default in defaults.items():
-            if key not in settings:
-                settings[key] = default
-                changed = True
-        if changed:
-            self.set_settings(settings)
+    def _save_config(self, settings) -> None:
+        """Save changed settings, refresh the snapshot and recompile the senders."""
+        super()._save_config(settings)
+        self._compile_senders()
 
     def update_key_image(self):
         # Default icon
@@ -69,9 +50,8 @@ class SendMidiCommand(ActionBase):
         if os.path.exists(icon_path):
             self.set_media(media_path=icon_path, size=0.75)
         
-        settings = self.get_settings()
-        msg_type = settings.get("msg_type", "note_on")
-        data1 = settings.get("data1", 60)
+        msg_type = self._config.msg_type
+        data1 = self._config.data1
         
         label = "MIDI"
         if msg_type == "note_on":
@@ -85,231 +65,69 @@ class SendMidiCommand(ActionBase):
             
         self.set_bottom_label(label, font_size=10)
 
-    def on_key_down(self) -> None:
-        if not self._midi_manager:
-            self.show_error(duration=1)
-            return
+    def _compile_senders(self) -> None:
+        """Compile the current settings into the callables used by on_key_down/on_key_up.
+
+        Message values are validated here once, so a keypress is a single call.
+        """
+        self._down_sender = self._show_send_error
+        self._up_sender = self._noop
 
-        settings = self.get_settings()
-        port_name = settings.get("port", "")
-        if not port_name:
-            self.show_error(duration=1)
+        config = self._config
+        if not self._midi_manager or not config.port:
             return
 
-        msg_type = settings.get("msg_type", "note_on")
-        channel = settings.get("channel", 0)
-        data1 = settings.get("data1", 60)
-        data2 = settings.get("data2", 100)
+        port_name = config.port
+        msg_type = config.msg_type
+        channel = config.channel
+        data1 = config.data1
+        data2 = config.data2
 
         # Map UI 0-16 (if user sees 1-16) generally MIDI channels are 0-15 in mido
         # I'll assume 0-indexed for now to be safe, typically devs prefer 0-15.
-        
-        if msg_type == "note_on":
-            self._midi_manager.send_note_on(port_name, channel, data1, data2)
-        elif msg_type == "control_change":
-             self._midi_manager.send_control_change(port_name, channel, data1, data2)
-        elif msg_type == "program_change":
-             self._midi_manager.send_program_change(port_name, channel, data1)
-        elif msg_type == "pitchwheel":
-             # data1 is the pitch value (-8192 to 8191)
-             self._midi_manager.send_pitchwheel(port_name, channel, data1)
-        elif msg_type == "note_off":
-            self._midi_manager.send_note_off(port_name, channel, data1)
-
-    def on_key_up(self) -> None:
-        # If type is Note On, send Note Off?
-        settings = self.get_settings()
-        msg_type = settings.get("msg_type", "note_on")
-        
-        if msg_type == "note_on":
-            port_name = settings.get("port", "")
-            channel = settings.get("channel", 0)
-            data1 = settings.get("data1", 0)
-            if self._midi_manager and port_name:
-                self._midi_manager.send_note_off(port_name, channel, data1)
-
-    def get_config_rows(self) -> list:
-        if ComboRow is None:
-            return []
-
-        settings = self.get_settings()
-        
-        rows = []
-
-        # -- Port Selection --
-        self.port_model = Gtk.ListStore(str)
-        self._refresh_port_list()
-        
-        self.port_row = ComboRow(title=self._lm("config.port"), model=self.port_model)
-        
-        renderer = Gtk.CellRendererText()
-        self.port_row.combo_box.pack_start(renderer, True)
-        self.port_row.combo_box.add_attribute(renderer, "text", 0)
-        
-        current_port = settings.get("port", "")
-        # Find index
-        active_index = 0
-        for i, row in enumerate(self.port_model):
-            if row[0] == current_port:
-                active_index = i
-                break
-        self.port_row.combo_box.set_active(active_index)
-        
-        self.port_row.combo_box.connect("changed", self.on_port_changed)
-        rows.append(self.port_row)
+        bank = config.bank
 
-        # -- Refresh Ports Button --
-        refresh_row = Adw.ActionRow()
-        refresh_row.set_title(self._lm("config.port.refresh"))
-        refresh_button = Gtk.Button()
-        refresh_button.set_icon_name("view-refresh-symbolic")
-        refresh_button.set_valign(Gtk.Align.CENTER)
-        refresh_button.connect("clicked", self._on_refresh_ports)
-        refresh_row.add_suffix(refresh_button)
-        rows.append(refresh_row)
-
-        # -- Message Type --
-        self.type_model = Gtk.ListStore(str, str) # Display, Internal Key
-        self.type_model.append([self._lm("config.msg_type.note_on"), "note_on"])
-        self.type_model.append([self._lm("config.msg_type.control_change"), "control_change"])
-        self.type_model.append([self._lm("config.msg_type.program_change"), "program_change"])
-        self.type_model.append([self._lm("config.msg_type.pitchwheel"), "pitchwheel"])
-        self.type_model.append([self._lm("config.msg_type.note_off"), "note_off"])
-
-        type_row = ComboRow(title=self._lm("config.msg_type"), model=self.type_model)
-        renderer_type = Gtk.CellRendererText()
-        type_row.combo_box.pack_start(renderer_type, True)
-        type_row.combo_box.add_attribute(renderer_type, "text", 0)
-        
-        current_type = settings.get("msg_type", "note_on")
-        active_type_index = 0
-        for i, row in enumerate(self.type_model):
-            if row[1] == current_type:
-                active_type_index = i
-                break
-        type_row.combo_box.set_active(active_type_index)
-        type_row.combo_box.connect("changed", self.on_type_changed)
-        rows.append(type_row)
-        
-        # -- Channel --
-        self.channel_row = Adw.SpinRow.new_with_range(0, 15, 1)
-        self.channel_row.set_title(self._lm("config.channel"))
-        self.channel_row.set_value(settings.get("channel", 0))
-        self.channel_row.connect("notify::value", self.on_channel_changed)
-        rows.append(self.channel_row)
-
-        # -- Data 1 (Note/Control/Program/Pitch) --
-        # Default range 0-127, will be updated for pitchwheel
-        self.data1_row = Adw.SpinRow.new_with_range(-8192, 8191, 1)
-        self.data1_row.set_value(settings.get("data1", 60))
-        self.data1_row.connect("notify::value", self.on_data1_changed)
-        rows.append(self.data1_row)
-
-        # -- Data 2 (Velocity/Value) --
-        self.data2_row = Adw.SpinRow.new_with_range(0, 127, 1)
-        self.data2_row.set_value(settings.get("data2", 100))
-        self.data2_row.connect("notify::value", self.on_data2_changed)
-        rows.append(self.data2_row)
-
-        # Initial Label Update
-        self.update_labels(current_type)
-        self._update_data1_range(current_type)
-
-        return rows
-
-    def _update_data1_range(self, msg_type):
-        """Update the data1 spin row range based on message type."""
-        adjustment = self.data1_row.get_adjustment()
-        if msg_type == "pitchwheel":
-            adjustment.set_lower(-8192)
-            adjustment.set_upper(8191)
-        else:
-            adjustment.set_lower(0)
-            adjustment.set_upper(127)
-            # Clamp current value to new range
-            current = self.data1_row.get_value()
-            if current < 0:
-                self.data1_row.set_value(0)
-            elif current > 127:
-                self.data1_row.set_value(127)
-
-    def on_port_changed(self, combo):
-        tree_iter = combo.get_active_iter()
-        if tree_iter:
-            model = combo.get_model()
-            port = model[tree_iter][0]
-            settings = self.get_settings()
-            settings["port"] = port
-            self.set_settings(settings)
+        try:
+            # Note Off was always sent with velocity 0, the velocity row only applies to Note On
+            velocity = 0 if msg_type == "note_off" else data2
+            down = self._midi_manager.compile(msg_type, channel, data1, velocity)
+            up = None
+            if msg_type == "note_on":
+                # Release sends the matching Note Off
+                up = self._midi_manager.compile("note_off", channel, data1, 0)
+            bank_select = None
+            if msg_type == "program_change" and bank >= 0:
+                bank_select = self._midi_manager.compile("control_change", channel, 0, bank)
+        except ValueError as e:
+            print(f"Invalid MIDI command settings: {e}")
+            return
 
-    def _refresh_port_list(self):
-        """Refresh the list of available MIDI ports."""
-        self.port_model.clear()
-        ports = []
-        if self._midi_manager:
-            ports = self._midi_manager.get_output_ports()
-        
-        if not ports:
-            self.port_model.append([self._lm("config.port.no_ports")])
+        send_raw = self._midi_manager.send_raw
+        if bank_select is not None:
+            # Bank Select (CC 0) must directly precede the Program Change
+            self._down_sender = partial(
+                self._midi_manager.send_batch, port_name, [bank_select.data, down.data]
+            )
         else:
-            for port in ports:
-                self.port_model.append([port])
-
-    def _on_refresh_ports(self, button):
-        """Handle refresh ports button click."""
-        settings = self.get_settings()
-        current_port = settings.get("port", "")
-        
-        self._refresh_port_list()
-        
-        # Try to reselect the current port
-        active_index = 0
-        for i, row in enumerate(self.port_model):
-            if row[0] == current_port:
-                active_index = i
-                break
-        self.port_row.combo_box.set_active(active_index)
+            self._down_sender = partial(send_raw, port_name, down.data)
+        if up is not None:
+            self._up_sender = partial(send_raw, port_name, up.data)
 
-    def on_type_changed(self, combo):
-        tree_iter = combo.get_active_iter()
-        if tree_iter:
-            model = combo.get_model()
-            msg_type = model[tree_iter][1]
-            settings = self.get_settings()
-            settings["msg_type"] = msg_type
-            self.set_settings(settings)
-            self.update_labels(msg_type)
-            self._update_data1_range(msg_type)
-            self.update_key_image()
+    def _show_send_error(self) -> None:
+        self.show_error(duration=1)
 
-    def on_channel_changed(self, widget, param):
-        settings = self.get_settings()
-        settings["channel"] = int(widget.get_value())
-        self.set_settings(settings)
+    def _noop(self) -> None:
+        pass
 
-    def on_data1_changed(self, widget, param):
-        settings = self.get_settings()
-        settings["data1"] = int(widget.get_value())
-        self.set_settings(settings)
-        self.update_key_image()
+    def on_key_down(self) -> None:
+        self._down_sender()
 
-    def on_data2_changed(self, widget, param):
-        settings = self.get_settings()
-        settings["data2"] = int(widget.get_value())
-        self.set_settings(settings)
+    def on_key_up(self) -> None:
+        self._up_sender()
 
-    def update_labels(self, msg_type):
-        if msg_type == "note_on" or msg_type == "note_off":
-            self.data1_row.set_title(self._lm("config.note"))
-            self.data2_row.set_title(self._lm("config.velocity"))
-            self.data2_row.set_visible(True)
-        elif msg_type == "control_change":
-            self.data1_row.set_title(self._lm("config.control_number"))
-            self.data2_row.set_title(self._lm("config.value"))
-            self.data2_row.set_visible(True)
-        elif msg_type == "program_change":
-            self.data1_row.set_title(self._lm("config.program_number"))
-            self.data2_row.set_visible(False)
-        elif msg_type == "pitchwheel":
-            self.data1_row.set_title(self._lm("config.pitch_value"))
-            self.data2_row.set_visible(False)
+    def get_config_rows(self) -> list:
+        """Return configuration rows for the action."""
+        # GTK is only imported once a config panel is opened
+        from .SendMidiCommandUI import SendMidiCommandConfigUI
+        self._config_ui = SendMidiCommandConfigUI(self)
+        return self._config_ui.get_config_rows()
@@ -0,0 +1,209 @@
+"""
+SendMidiCommandUI - Config panel for the Send MIDI Command action.
+
+Imported on first use from SendMidiCommand.get_config_rows, so loading the plugin
+does not require GTK.
+"""
+import gi
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Gtk, Adw
+
+from ...internal.ConfigModels import ConfigModels
+
+# Import GtkHelper for ComboRow
+try:
+    from GtkHelper.GtkHelper import ComboRow
+except ImportError:
+    print("Failed to import GtkHelper. Using fallback or failing.")
+    ComboRow = None
+
+
+class SendMidiCommandConfigUI:
+    """Builds the config rows for a SendMidiCommand action and writes changes back to it."""
+
+    def __init__(self, action):
+        self.action = action
+
+    def get_config_rows(self) -> list:
+        if ComboRow is None:
+            return []
+
+        settings = self.action.get_settings()
+        
+        rows = []
+
+        # -- Port Selection --
+        # Port model shared by all panels, see ConfigModels
+        self._refresh_port_list()
+        
+        self.port_row = ComboRow(title=self.action._lm("config.port"), model=self.port_choices.store)
+        
+        renderer = Gtk.CellRendererText()
+        self.port_row.combo_box.pack_start(renderer, True)
+        self.port_row.combo_box.add_attribute(renderer, "text", 0)
+        
+        current_port = settings.get("port", "")
+        # Find index
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+        
+        self.port_row.combo_box.connect("changed", self.on_port_changed)
+        rows.append(self.port_row)
+
+        # -- Refresh Ports Button --
+        refresh_row = Adw.ActionRow()
+        refresh_row.set_title(self.action._lm("config.port.refresh"))
+        refresh_button = Gtk.Button()
+        refresh_button.set_icon_name("view-refresh-symbolic")
+        refresh_button.set_valign(Gtk.Align.CENTER)
+        refresh_button.connect("clicked", self._on_refresh_ports)
+        refresh_row.add_suffix(refresh_button)
+        rows.append(refresh_row)
+
+        # -- Message Type --
+        self.type_choices = ConfigModels.choices("send_midi_command.msg_type", self.action, lambda: [
+            (self.action._lm("config.msg_type.note_on"), "note_on"),
+            (self.action._lm("config.msg_type.control_change"), "control_change"),
+            (self.action._lm("config.msg_type.program_change"), "program_change"),
+            (self.action._lm("config.msg_type.pitchwheel"), "pitchwheel"),
+            (self.action._lm("config.msg_type.note_off"), "note_off"),
+        ])
+
+        type_row = ComboRow(title=self.action._lm("config.msg_type"), model=self.type_choices.store)
+        renderer_type = Gtk.CellRendererText()
+        type_row.combo_box.pack_start(renderer_type, True)
+        type_row.combo_box.add_attribute(renderer_type, "text", 0)
+        
+        current_type = settings.get("msg_type", "note_on")
+        active_type_index = self.type_choices.index_of(current_type)
+        type_row.combo_box.set_active(active_type_index)
+        type_row.combo_box.connect("changed", self.on_type_changed)
+        rows.append(type_row)
+        
+        # -- Channel --
+        self.channel_row = Adw.SpinRow.new_with_range(0, 15, 1)
+        self.channel_row.set_title(self.action._lm("config.channel"))
+        self.channel_row.set_value(settings.get("channel", 0))
+        self.channel_row.connect("notify::value", self.on_channel_changed)
+        rows.append(self.channel_row)
+
+        # -- Data 1 (Note/Control/Program/Pitch) --
+        # Default range 0-127, will be updated for pitchwheel
+        self.data1_row = Adw.SpinRow.new_with_range(-8192, 8191, 1)
+        self.data1_row.set_value(settings.get("data1", 60))
+        self.data1_row.connect("notify::value", self.on_data1_changed)
+        rows.append(self.data1_row)
+
+        # -- Data 2 (Velocity/Value) --
+        self.data2_row = Adw.SpinRow.new_with_range(0, 127, 1)
+        self.data2_row.set_value(settings.get("data2", 100))
+        self.data2_row.connect("notify::value", self.on_data2_changed)
+        rows.append(self.data2_row)
+
+        # -- Bank (Program Change only) --
+        self.bank_row = Adw.SpinRow.new_with_range(-1, 127, 1)
+        self.bank_row.set_title(self.action._lm("config.bank"))
+        self.bank_row.set_subtitle(self.action._lm("config.bank.subtitle"))
+        self.bank_row.set_value(settings.get("bank", -1))
+        self.bank_row.connect("notify::value", self.on_bank_changed)
+        rows.append(self.bank_row)
+
+        # Initial Label Update
+        self.update_labels(current_type)
+        self._update_data1_range(current_type)
+
+        return rows
+
+    def _update_data1_range(self, msg_type):
+        """Update the data1 spin row range based on message type."""
+        adjustment = self.data1_row.get_adjustment()
+        if msg_type == "pitchwheel":
+            adjustment.set_lower(-8192)
+            adjustment.set_upper(8191)
+        else:
+            adjustment.set_lower(0)
+            adjustment.set_upper(127)
+            # Clamp current value to new range
+            current = self.data1_row.get_value()
+            if current < 0:
+                self.data1_row.set_value(0)
+            elif current > 127:
+                self.data1_row.set_value(127)
+
+    def on_port_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            port = model[tree_iter][0]
+            settings = self.action.get_settings()
+            settings["port"] = port
+            self.action._save_config(settings)
+            self.action._watch_port(port)
+
+    def _refresh_port_list(self, rescan=False):
+        """Point the port row at the shared port model, refreshed from the port directory."""
+        self.port_choices = ConfigModels.ports(
+            self.action._midi_manager, self.action._lm("config.port.no_ports"), rescan=rescan
+        )
+
+    def _on_refresh_ports(self, button):
+        """Handle refresh ports button click."""
+        settings = self.action.get_settings()
+        current_port = settings.get("port", "")
+        
+        self._refresh_port_list(rescan=True)
+        
+        # Try to reselect the current port
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+
+    def on_type_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            msg_type = model[tree_iter][1]
+            settings = self.action.get_settings()
+            settings["msg_type"] = msg_type
+            self.action._save_config(settings)
+            self.update_labels(msg_type)
+            self._update_data1_range(msg_type)
+            self.action.update_key_image()
+
+    def on_channel_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["channel"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def on_data1_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["data1"] = int(widget.get_value())
+        self.action._save_config(settings)
+        self.action.update_key_image()
+
+    def on_data2_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["data2"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def on_bank_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["bank"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def update_labels(self, msg_type):
+        self.bank_row.set_visible(msg_type == "program_change")
+        if msg_type == "note_on" or msg_type == "note_off":
+            self.data1_row.set_title(self.action._lm("config.note"))
+            self.data2_row.set_title(self.action._lm("config.velocity"))
+            self.data2_row.set_visible(True)
+        elif msg_type == "control_change":
+            self.data1_row.set_title(self.action._lm("config.control_number"))
+            self.data2_row.set_title(self.action._lm("config.value"))
+            self.data2_row.set_visible(True)
+        elif msg_type == "program_change":
+            self.data1_row.set_title(self.action._lm("config.program_number"))
+            self.data2_row.set_visible(False)
+        elif msg_type == "pitchwheel":
+            self.data1_row.set_title(self.action._lm("config.pitch_value"))
+            self.data2_row.set_visible(False)
@@ -0,0 +1,131 @@
+"""
+SendNoteUI - Config panel for the Send MIDI Note action.
+
+Imported on first use from SendNote.get_config_rows, so loading the plugin
+does not require GTK.
+"""
+import gi
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Gtk, Adw
+
+from ...internal.ConfigModels import ConfigModels
+
+# Import GtkHelper for ComboRow
+try:
+    from GtkHelper.GtkHelper import ComboRow
+except ImportError:
+    print("Failed to import GtkHelper. Using fallback or failing.")
+    ComboRow = None
+
+
+class SendNoteConfigUI:
+    """Builds the config rows for a SendNote action and writes changes back to it."""
+
+    def __init__(self, action):
+        self.action = action
+
+    def get_config_rows(self) -> list:
+        """Return configuration rows for the action."""
+        if ComboRow is None:
+            return []
+
+        settings = self.action.get_settings()
+
+        # Port model shared by all panels, see ConfigModels
+        self._refresh_port_list()
+
+        # Create ComboRow using GtkHelper
+        self.port_row = ComboRow(title=self.action._lm("config.port"), model=self.port_choices.store)
+        
+        # Setup CellRenderer for the internal ComboBox
+        renderer = Gtk.CellRendererText()
+        self.port_row.combo_box.pack_start(renderer, True)
+        self.port_row.combo_box.add_attribute(renderer, "text", 0)
+
+        # Set current selection
+        current_port = settings.get("port", "")
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+        
+        # Connect signal to save setting
+        self.port_row.combo_box.connect("changed", self.on_port_changed)
+        
+        rows = [self.port_row]
+
+        # -- Refresh Ports Button --
+        refresh_row = Adw.ActionRow()
+        refresh_row.set_title(self.action._lm("config.port.refresh"))
+        refresh_button = Gtk.Button()
+        refresh_button.set_icon_name("view-refresh-symbolic")
+        refresh_button.set_valign(Gtk.Align.CENTER)
+        refresh_button.connect("clicked", self._on_refresh_ports)
+        refresh_row.add_suffix(refresh_button)
+        rows.append(refresh_row)
+
+        # -- Channel --
+        self.channel_row = Adw.SpinRow.new_with_range(0, 15, 1)
+        self.channel_row.set_title(self.action._lm("config.channel"))
+        self.channel_row.set_value(settings.get("channel", 0))
+        self.channel_row.connect("notify::value", self.on_channel_changed)
+        rows.append(self.channel_row)
+
+        # -- Note --
+        self.note_row = Adw.SpinRow.new_with_range(0, 127, 1)
+        self.note_row.set_title(self.action._lm("config.note"))
+        self.note_row.set_value(settings.get("note", 60))
+        self.note_row.connect("notify::value", self.on_note_changed)
+        rows.append(self.note_row)
+
+        # -- Velocity --
+        self.velocity_row = Adw.SpinRow.new_with_range(0, 127, 1)
+        self.velocity_row.set_title(self.action._lm("config.velocity"))
+        self.velocity_row.set_value(settings.get("velocity", 100))
+        self.velocity_row.connect("notify::value", self.on_velocity_changed)
+        rows.append(self.velocity_row)
+
+        return rows
+
+    def _refresh_port_list(self, rescan=False):
+        """Point the port row at the shared port model, refreshed from the port directory."""
+        self.port_choices = ConfigModels.ports(
+            self.action._midi_manager, self.action._lm("config.port.no_ports"), rescan=rescan
+        )
+
+    def _on_refresh_ports(self, button):
+        """Handle refresh ports button click."""
+        settings = self.action.get_settings()
+        current_port = settings.get("port", "")
+        
+        self._refresh_port_list(rescan=True)
+        
+        # Try to reselect the current port
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+
+    def on_port_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            port = model[tree_iter][0]
+            settings = self.action.get_settings()
+            settings["port"] = port
+            self.action._save_config(settings)
+            self.action._watch_port(port)
+
+    def on_channel_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["channel"] = int(widget.get_value())
+        self.action._save_config(settings)
+
+    def on_note_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["note"] = int(widget.get_value())
+        self.action._save_config(settings)
+        # Update label
+        self.action.set_bottom_label(f"Note {settings['note']}", font_size=14)
+
+    def on_velocity_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["velocity"] = int(widget.get_value())
+        self.action._save_config(settings)
@@ -0,0 +1,169 @@
+from src.backend.PluginManager.ActionBase import ActionBase
+from functools import partial
+import os
+import time
+
+from ...internal.ActionConfig import ConfigMixin, SendSequenceConfig
+from ...internal.Scheduler import Scheduler
+from ...internal.PortWatch import PortWatchMixin
+
+
+class SendSequence(ConfigMixin, PortWatchMixin, ActionBase):
+    _config_class = SendSequenceConfig
+
+    """
+    Action that plays an ordered list of MIDI messages with per-step delays.
+
+    Steps are written as "<delay> <type> <channel> <data1> [data2]" and separated
+    by semicolons or new lines, e.g. "0 pc 0 5; 250 note_on 0 60 100; 500 note_off 0 60".
+    Each delay is relative to the previous step, in milliseconds or beats.
+    Timing is handled by the shared Scheduler, not by a thread per press.
+    """
+
+    # Short names accepted in the step syntax
+    TYPE_ALIASES = {
+        "note_on": "note_on",
+        "on": "note_on",
+        "note_off": "note_off",
+        "off": "note_off",
+        "control_change": "control_change",
+        "cc": "control_change",
+        "program_change": "program_change",
+        "pc": "program_change",
+        "pitchwheel": "pitchwheel",
+        "pw": "pitchwheel",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Shared MIDI service, initialized once by the plugin
+        self._midi_manager = self.plugin_base.midi_manager
+        self._scheduler = Scheduler.get()
+        # Config panel, created on first get_config_rows
+        self._config_ui = None
+        # Settings snapshot, rebuilt by _save_config
+        self._config = SendSequenceConfig()
+        # Compiled steps as (offset in seconds from the start, raw bytes)
+        self._steps = []
+        # Scheduled calls of the current run as (ScheduledCall, raw bytes)
+        self._pending_calls = []
+        self._pending_port = None
+
+    def _lm(self, key: str) -> str:
+        """Get localized string with fallback to key."""
+        try:
+            return self.plugin_base.locale_manager.get(key)
+        except Exception:
+            return key
+
+    def on_ready(self) -> None:
+        self._ensure_default_settings()
+        self._build_config(self.get_settings())
+        self._compile_steps()
+
+        icon_path = os.path.join(self.plugin_base.PATH, "assets", "midi.png")
+        if os.path.exists(icon_path):
+            self.set_media(media_path=icon_path, size=0.75)
+        self._update_label()
+        self._watch_port(self._config.port)
+
+    def _save_config(self, settings) -> None:
+        """Save changed settings, refresh the snapshot and recompile the steps."""
+        super()._save_config(settings)
+        self._compile_steps()
+
+    def on_removed_from_cache(self) -> None:
+        """Stop playback and release the port reference."""
+        self._cancel_pending()
+        super().on_removed_from_cache()
+
+    def _update_label(self):
+        self.set_bottom_label(f"SEQ {len(self._steps)}", font_size=10)
+
+    def _compile_steps(self) -> None:
+        """Parse and validate the step list once, converting delays to absolute offsets."""
+        self._steps = []
+        if not self._midi_manager:
+            return
+        config = self._config
+        try:
+            self._steps = self.parse_steps(config.steps, config.unit, config.bpm, self._midi_manager.compile)
+        except ValueError as e:
+            print(f"Invalid MIDI sequence: {e}")
+
+    @classmethod
+    def parse_steps(cls, text, unit, bpm, compile_message):
+        """Parse the step syntax into [(offset_seconds, raw bytes)].
+
+        Raises:
+            ValueError: If a step is malformed or a value is out of range.
+        """
+        seconds_per_unit = 60.0 / max(1.0, float(bpm)) if unit == "beats" else 0.001
+        steps = []
+        offset = 0.0
+        for raw_step in text.replace("\n", ";").split(";"):
+            parts = raw_step.split()
+            if not parts:
+                continue
+            if len(parts) < 4:
+                raise ValueError(f"step '{raw_step.strip()}' needs delay, type, channel and data1")
+            if len(parts) > 5:
+                raise ValueError(f"step '{raw_step.strip()}' has more than delay, type, channel, data1 and data2")
+            msg_type = cls.TYPE_ALIASES.get(parts[1].lower())
+            if msg_type is None:
+                raise ValueError(f"unknown message type '{parts[1]}'")
+            delay = float(parts[0])
+            if delay < 0:
+                raise ValueError(f"negative delay in step '{raw_step.strip()}'")
+            offset += delay * seconds_per_unit
+            values = [int(v) for v in parts[2:5]]
+            template = compile_message(msg_type, *values)
+            steps.append((offset, template.data))
+        return steps
+
+    def on_key_down(self) -> None:
+        port_name = self._config.port
+        if not self._midi_manager or not port_name or not self._steps:
+            self.show_error(duration=1)
+            return
+
+        # Restart the sequence if it is still playing
+        self._cancel_pending()
+        send_raw = self._midi_manager.send_raw
+        start = time.monotonic()
+        self._pending_port = port_name
+        self._pending_calls = [
+            (self._scheduler.schedule_at(start + offset, partial(send_raw, port_name, data)), data)
+            for offset, data in self._steps
+        ]
+
+    def _cancel_pending(self):
+        """Stop the current run, releasing notes it started.
+
+        Note Offs that were still pending are sent right away for every note
+        whose Note On already went out, so no note is left hanging.
+        """
+        sounding = set()
+        releases = []
+        for call, data in self._pending_calls:
+            ran = self._scheduler.cancel(call)
+            status = data[0] & 0xF0
+            if status == 0x90 and data[2] > 0:
+                if ran:
+                    sounding.add((data[0] & 0x0F, data[1]))
+            elif status == 0x80 or status == 0x90:
+                key = (data[0] & 0x0F, data[1])
+                if key in sounding:
+                    sounding.discard(key)
+                    if not ran:
+                        releases.append(data)
+        self._pending_calls = []
+        if releases and self._midi_manager:
+            self._midi_manager.send_batch(self._pending_port, releases)
+
+    def get_config_rows(self) -> list:
+        """Return configuration rows for the action."""
+        # GTK is only imported once a config panel is opened
+        from .SendSequenceUI import SendSequenceConfigUI
+        self._config_ui = SendSequenceConfigUI(self)
+        return self._config_ui.get_config_rows()
@@ -0,0 +1,140 @@
+"""
+SendSequenceUI - Config panel for the Send MIDI Sequence action.
+
+Imported on first use from SendSequence.get_config_rows, so loading the plugin
+does not require GTK.
+"""
+import gi
+gi.require_version("Gtk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Gtk, Adw
+
+from ...internal.ConfigModels import ConfigModels
+
+# Import GtkHelper for ComboRow
+try:
+    from GtkHelper.GtkHelper import ComboRow
+except ImportError:
+    print("Failed to import GtkHelper. Using fallback or failing.")
+    ComboRow = None
+
+
+class SendSequenceConfigUI:
+    """Builds the config rows for a SendSequence action and writes changes back to it."""
+
+    def __init__(self, action):
+        self.action = action
+
+    def get_config_rows(self) -> list:
+        if ComboRow is None:
+            return []
+
+        settings = self.action.get_settings()
+        rows = []
+
+        # -- Port Selection --
+        # Port model shared by all panels, see ConfigModels
+        self._refresh_port_list()
+
+        self.port_row = ComboRow(title=self.action._lm("config.port"), model=self.port_choices.store)
+
+        renderer = Gtk.CellRendererText()
+        self.port_row.combo_box.pack_start(renderer, True)
+        self.port_row.combo_box.add_attribute(renderer, "text", 0)
+
+        current_port = settings.get("port", "")
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+        self.port_row.combo_box.connect("changed", self.on_port_changed)
+        rows.append(self.port_row)
+
+        # -- Refresh Ports Button --
+        refresh_row = Adw.ActionRow()
+        refresh_row.set_title(self.action._lm("config.port.refresh"))
+        refresh_button = Gtk.Button()
+        refresh_button.set_icon_name("view-refresh-symbolic")
+        refresh_button.set_valign(Gtk.Align.CENTER)
+        refresh_button.connect("clicked", self._on_refresh_ports)
+        refresh_row.add_suffix(refresh_button)
+        rows.append(refresh_row)
+
+        # -- Steps --
+        self.steps_row = Adw.EntryRow()
+        self.steps_row.set_title(self.action._lm("config.sequence.steps"))
+        self.steps_row.set_text(settings.get("steps", ""))
+        self.steps_row.set_show_apply_button(True)
+        self.steps_row.connect("apply", self.on_steps_changed)
+        rows.append(self.steps_row)
+
+        # -- Delay Unit --
+        self.unit_choices = ConfigModels.choices("send_sequence.unit", self.action, lambda: [
+            (self.action._lm("config.sequence.unit.ms"), "ms"),
+            (self.action._lm("config.sequence.unit.beats"), "beats"),
+        ])
+
+        self.unit_row = ComboRow(title=self.action._lm("config.sequence.unit"), model=self.unit_choices.store)
+        unit_renderer = Gtk.CellRendererText()
+        self.unit_row.combo_box.pack_start(unit_renderer, True)
+        self.unit_row.combo_box.add_attribute(unit_renderer, "text", 0)
+
+        current_unit = settings.get("unit", "ms")
+        unit_active_index = self.unit_choices.index_of(current_unit)
+        self.unit_row.combo_box.set_active(unit_active_index)
+        self.unit_row.combo_box.connect("changed", self.on_unit_changed)
+        rows.append(self.unit_row)
+
+        # -- Tempo --
+        self.bpm_row = Adw.SpinRow.new_with_range(20, 300, 1)
+        self.bpm_row.set_title(self.action._lm("config.sequence.bpm"))
+        self.bpm_row.set_subtitle(self.action._lm("config.sequence.bpm.subtitle"))
+        self.bpm_row.set_value(settings.get("bpm", 120))
+        self.bpm_row.connect("notify::value", self.on_bpm_changed)
+        rows.append(self.bpm_row)
+
+        return rows
+
+    def _refresh_port_list(self, rescan=False):
+        """Point the port row at the shared port model, refreshed from the port directory."""
+        self.port_choices = ConfigModels.ports(
+            self.action._midi_manager, self.action._lm("config.port.no_ports"), rescan=rescan
+        )
+
+    def _on_refresh_ports(self, button):
+        """Handle refresh ports button click."""
+        settings = self.action.get_settings()
+        current_port = settings.get("port", "")
+
+        self._refresh_port_list(rescan=True)
+
+        # Try to reselect the current port
+        active_index = self.port_choices.index_of(current_port)
+        self.port_row.combo_box.set_active(active_index)
+
+    def on_port_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            port = model[tree_iter][0]
+            settings = self.action.get_settings()
+            settings["port"] = port
+            self.action._save_config(settings)
+            self.action._watch_port(port)
+
+    def on_steps_changed(self, entry):
+        settings = self.action.get_settings()
+        settings["steps"] = entry.get_text()
+        self.action._save_config(settings)
+        self.action._update_label()
+
+    def on_unit_changed(self, combo):
+        tree_iter = combo.get_active_iter()
+        if tree_iter:
+            model = combo.get_model()
+            settings = self.action.get_settings()
+            settings["unit"] = model[tree_iter][1]
+            self.action._save_config(settings)
+
+    def on_bpm_changed(self, widget, param):
+        settings = self.action.get_settings()
+        settings["bpm"] = int(widget.get_value())
+        self.action._save_config(settings)
@@ -0,0 +1 @@
+# SendSequence Action
@@ -0,0 +1,100 @@
+"""
+Plugin load time benchmark: importing main.py and constructing MidiPlugin.
+
+Each sample runs in a fresh interpreter so every module is imported cold. The
+child reports how long the plugin took to load, which GTK-side modules
+(gi, GtkHelper) were imported by then, and how long the first config panel
+took to build, which is where GTK is expected to be imported. It then opens
+every action's panel twice; the second pass reuses the shared config models.
+
+With --real-gi the installed PyGObject is imported instead of the gi stub,
+which shows the actual cost saved on headless deployments.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat N] [--real-gi] [--output FILE]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def child(real_gi):
+    import stubs
+    stubs.install(real_gi=real_gi, plugin=False)
+
+    start = time.perf_counter()
+    plugin = stubs.load_plugin()
+    load_s = time.perf_counter() - start
+    ui_at_load = list(stubs.ui_imports)
+
+    actions = [holder["action_base"](plugin_base=plugin, settings={}) for holder in plugin.action_holders]
+    start = time.perf_counter()
+    actions[0].get_config_rows()
+    first_panel_s = time.perf_counter() - start
+    panel_passes = []
+    for _ in range(2):
+        start = time.perf_counter()
+        for action in actions:
+            action.get_config_rows()
+        panel_passes.append(time.perf_counter() - start)
+
+    return {
+        "load_ms": load_s * 1000,
+        "first_config_panel_ms": first_panel_s * 1000,
+        "all_config_panels_ms": panel_passes[0] * 1000,
+        "reopen_config_panels_ms": panel_passes[1] * 1000,
+        "ui_modules_at_load": ui_at_load,
+        "ui_modules_after_config": list(stubs.ui_imports),
+        "real_gi": "gi" not in stubs.ui_imports and "gi" in sys.modules,
+    }
+
+
+def _summary(samples, key):
+    values = sorted(s[key] for s in samples)
+    return {"median": statistics.median(values), "min": values[0], "max": values[-1]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="number of cold-start samples")
+    parser.add_argument("--real-gi", action="store_true", help="import the installed PyGObject if available")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = child(args.real_gi)
+        sys.stdout.flush()
+        sys.__stdout__.write("\n" + json.dumps(result) + "\n")
+        return 0
+
+    command = [sys.executable, os.path.abspath(__file__), "--child"]
+    if args.real_gi:
+        command.append("--real-gi")
+    samples = []
+    for _ in range(args.repeat):
+        proc = subprocess.run(command, capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    output = json.dumps({
+        "repeat": args.repeat,
+        "real_gi": samples[0]["real_gi"],
+        **{key: _summary(samples, key) for key in (
+            "load_ms", "first_config_panel_ms", "all_config_panels_ms", "reopen_config_panels_ms")},
+        "ui_modules_at_load": samples[0]["ui_modules_at_load"],
+        "ui_modules_after_config": samples[0]["ui_modules_after_config"],
+    }, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
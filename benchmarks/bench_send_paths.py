@@ -0,0 +1,53 @@
+"""
+Microbenchmark: mido.Message send path vs. the precompiled raw-bytes path.
+
+Runs against the stub mido backend, whose ports mimic rtmidi but discard
+their output, so only the plugin's own per-message overhead is measured.
+
+Usage:
+    python benchmarks/bench_send_paths.py [--count N]
+"""
+import argparse
+import time
+
+import stubs
+
+
+def measure(label, func, count):
+    func(0)  # warm up: opens the port
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<40} {rate:>12,.0f} msg/s {elapsed / count * 1e6:>8.2f} us/msg")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    MidiManager = stubs.install().midi_manager
+    import stub_backend
+
+    port = stub_backend.DEFAULT_PORT
+    template = MidiManager.compile("control_change", 0, 7)
+
+    baseline = measure(
+        "send_control_change (mido.Message)",
+        lambda i: MidiManager.send_control_change(port, 0, 7, i & 0x7F),
+        args.count,
+    )
+    fast = measure(
+        "send_raw (precompiled template)",
+        lambda i: MidiManager.send_raw(port, template.with_value(i)),
+        args.count,
+    )
+    print(f"speedup: {fast / baseline:.1f}x")
+    MidiManager.close_all_ports()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Regression check: the messages MidiManager.send_high_res writes for a receiver
+that is shared by several dials and other actions.
+
+Drives two NRPN dials and a 14-bit dial on one channel of the in-process
+loopback port, interleaved with plain Control Changes, and compares the bytes
+that arrive with what a receiver needs to end up at each value. Exits non-zero
+on the first mismatch.
+
+Usage:
+    python benchmarks/check_high_res.py [--async]
+"""
+import argparse
+import sys
+import time
+
+import stubs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--async", dest="async_dispatch", action="store_true", help="use background dispatch")
+    args = parser.parse_args()
+
+    manager = stubs.install().midi_manager
+    import mido
+    import loopback_backend
+
+    mido.set_backend("loopback_backend", load=True)
+    manager.invalidate_port_cache()
+    manager.set_async_dispatch(args.async_dispatch)
+    port = loopback_backend.PORT_NAME
+    received = []
+    loopback_backend.set_listener(lambda data: received.append(tuple(data)))
+
+    nrpn_a = manager.high_res_encoder("nrpn", 0, 1)
+    nrpn_b = manager.high_res_encoder("nrpn", 0, 2)
+    volume = manager.high_res_encoder("14bit", 0, 7)
+    cc_volume = manager.compile("control_change", 0, 7)
+
+    select_a = [(0xB0, 99, 0), (0xB0, 98, 1)]
+    select_b = [(0xB0, 99, 0), (0xB0, 98, 2)]
+    cases = [
+        ("first value selects the parameter", lambda: manager.send_high_res(port, nrpn_a, 300),
+         select_a + [(0xB0, 6, 2), (0xB0, 38, 44)]),
+        ("fine adjustment is a single LSB", lambda: manager.send_high_res(port, nrpn_a, 301),
+         [(0xB0, 38, 45)]),
+        ("second parameter is selected", lambda: manager.send_high_res(port, nrpn_b, 302),
+         select_b + [(0xB0, 6, 2), (0xB0, 38, 46)]),
+        # A/B/A: the receiver now has B selected, so A must be selected again
+        ("first parameter is selected again", lambda: manager.send_high_res(port, nrpn_a, 302),
+         select_a + [(0xB0, 6, 2), (0xB0, 38, 46)]),
+        ("14-bit dial sends MSB and LSB", lambda: manager.send_high_res(port, volume, 1000),
+         [(0xB0, 7, 7), (0xB0, 39, 104)]),
+        ("plain CC 7 from another action", lambda: manager.send_raw(port, cc_volume.with_value(100)),
+         [(0xB0, 7, 100)]),
+        # The receiver's MSB is now 100, so the dial must send its own again
+        ("14-bit dial restores its MSB", lambda: manager.send_high_res(port, volume, 1001),
+         [(0xB0, 7, 7), (0xB0, 39, 105)]),
+        ("parameter select from another action", lambda: manager.send_control_change(port, 0, 98, 2),
+         [(0xB0, 98, 2)]),
+        ("first parameter is selected after a foreign select", lambda: manager.send_high_res(port, nrpn_a, 303),
+         select_a + [(0xB0, 6, 2), (0xB0, 38, 47)]),
+    ]
+
+    failures = 0
+    for name, step, expected in cases:
+        received.clear()
+        step()
+        manager.flush()
+        deadline = time.monotonic() + 1.0
+        while len(received) < len(expected) and time.monotonic() < deadline:
+            time.sleep(0.001)
+        time.sleep(0.01)
+        ok = received == expected
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            print(f"     expected {expected}\n     received {received}")
+
+    manager.close_all_ports()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+In-process loopback mido backend.
+
+Stand-in for a virtual MIDI cable when no ALSA sequencer is available: bytes
+written to the output port are handed to a delivery thread, which passes them
+to the listener registered with set_listener(). Select it with
+mido.set_backend("loopback_backend", load=True).
+"""
+import queue
+import threading
+
+from mido.ports import BaseInput, BaseOutput
+
+PORT_NAME = "Loopback MIDI"
+
+_listener = None
+_wire = queue.SimpleQueue()
+
+
+def set_listener(callback):
+    """Register callback(data) to receive every message written to the loopback port."""
+    global _listener
+    _listener = callback
+
+
+def _deliver():
+    while True:
+        data = _wire.get()
+        listener = _listener
+        if listener is not None:
+            listener(data)
+
+
+threading.Thread(target=_deliver, name="LoopbackWire", daemon=True).start()
+
+
+def get_devices(**kwargs):
+    return [{"name": PORT_NAME, "is_input": False, "is_output": True}]
+
+
+class _LoopbackMidiOut:
+    """Stands in for rtmidi.MidiOut."""
+
+    def send_message(self, data):
+        _wire.put(tuple(data))
+
+
+class Output(BaseOutput):
+    def _open(self, **kwargs):
+        if self.name != PORT_NAME:
+            raise IOError(f"unknown port {self.name!r}")
+        self._rt = _LoopbackMidiOut()
+        self._send_lock = threading.RLock()
+
+    def send(self, msg):
+        with self._send_lock:
+            self._rt.send_message(msg.bytes())
+
+
+class Input(BaseInput):
+    def _open(self, **kwargs):
+        raise IOError("the loopback backend has no inputs")
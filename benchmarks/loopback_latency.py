@@ -0,0 +1,199 @@
+"""
+End-to-end loopback latency harness.
+
+Opens a virtual MIDI input on the local machine (rtmidi, e.g. ALSA's virtual
+sequencer), points MidiManager and the SendNote, SendMidiCommand and MidiDial
+actions at the matching output, and drives them through scripted event
+sequences. For every event it measures the time until the messages arrive on
+the input, and reports latency, jitter and message loss as JSON.
+
+Without a usable rtmidi/ALSA setup it falls back to an in-process loopback
+backend (loopback_backend.py), which still covers the plugin's own path.
+
+Usage:
+    python benchmarks/loopback_latency.py [--events N] [--async] [--backend auto|rtmidi|inprocess]
+"""
+import argparse
+import contextlib
+import json
+import statistics
+import sys
+import threading
+import time
+
+import stubs
+
+VIRTUAL_PORT = "MidiPluginLoopback"
+
+
+class Receiver:
+    """Collects (arrival time, bytes) for every message that comes back."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._arrivals = []
+
+    def on_bytes(self, data):
+        now = time.perf_counter_ns()
+        with self._cond:
+            self._arrivals.append((now, tuple(data)))
+            self._cond.notify_all()
+
+    def on_message(self, msg):
+        self.on_bytes(msg.bytes())
+
+    def wait_for(self, count, timeout):
+        """Wait until `count` messages arrived (or timeout) and return and clear them."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while len(self._arrivals) < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            arrivals, self._arrivals = self._arrivals, []
+        return arrivals
+
+
+def open_rtmidi_loopback(receiver):
+    """Open a virtual rtmidi input and return (output port name, input port)."""
+    import mido
+    mido.set_backend("mido.backends.rtmidi", load=True)
+    inport = mido.open_input(VIRTUAL_PORT, virtual=True, callback=receiver.on_message)
+    for _ in range(50):
+        names = [name for name in mido.get_output_names() if VIRTUAL_PORT in name]
+        if names:
+            return names[0], inport
+        time.sleep(0.02)
+    inport.close()
+    raise IOError("virtual port did not show up as an output")
+
+
+def open_inprocess_loopback(receiver):
+    import mido
+    import loopback_backend
+    mido.set_backend("loopback_backend", load=True)
+    loopback_backend.set_listener(receiver.on_bytes)
+    return loopback_backend.PORT_NAME, None
+
+
+def run_scenario(name, steps, receiver, timeout):
+    """Run (callable, expected message count) steps and summarise the results."""
+    latencies = []
+    sent = received = 0
+    for step, expected in steps:
+        start = time.perf_counter_ns()
+        step()
+        arrivals = receiver.wait_for(expected, timeout) if expected else []
+        sent += expected
+        received += min(expected, len(arrivals))
+        latencies.extend(arrived - start for arrived, _ in arrivals[:expected])
+
+    result = {"sent": sent, "received": received, "lost": sent - received}
+    if latencies:
+        samples = sorted(latencies)
+        n = len(samples)
+        result.update({
+            "mean_us": statistics.fmean(samples) / 1000,
+            "p50_us": samples[n // 2] / 1000,
+            "p99_us": samples[min(n - 1, int(0.99 * n))] / 1000,
+            "max_us": samples[-1] / 1000,
+            # Jitter: mean absolute difference between consecutive latencies
+            "jitter_us": (statistics.fmean(abs(a - b) for a, b in zip(latencies, latencies[1:])) / 1000)
+            if n > 1 else 0.0,
+        })
+    return name, result
+
+
+def build_scenarios(plugin_base, manager, port, events):
+    from midi_plugin.actions.SendNote.SendNote import SendNote
+    from midi_plugin.actions.SendMidiCommand.SendMidiCommand import SendMidiCommand
+    from midi_plugin.actions.MidiDial.MidiDial import MidiDial
+
+    note = SendNote(plugin_base=plugin_base, settings={"port": port, "note": 60, "velocity": 100})
+    note.on_ready()
+    command = SendMidiCommand(plugin_base=plugin_base, settings={
+        "port": port, "msg_type": "control_change", "data1": 20, "data2": 64,
+    })
+    command.on_ready()
+    dial = MidiDial(plugin_base=plugin_base, settings={"port": port, "step_size": 1, "coalesce_cc": False})
+    dial.on_ready()
+
+    cc = manager.compile("control_change", 0, 7)
+    actions = (note, command, dial)
+    scenarios = {
+        "manager.send_control_change": [
+            (lambda i=i: manager.send_control_change(port, 0, 7, i & 0x7F), 1) for i in range(events)
+        ],
+        "manager.send_raw": [
+            (lambda i=i: manager.send_raw(port, cc.with_value(i)), 1) for i in range(events)
+        ],
+        # Key down sends Note On, key up sends Note Off
+        "SendNote": [step for _ in range(events // 2) for step in ((note.on_key_down, 1), (note.on_key_up, 1))],
+        "SendMidiCommand": [(command.on_key_down, 1) for _ in range(events)],
+        # Sweep up and down between 64 and 114, so every detent changes the value
+        # (detents at the min/max bound are not sent at all)
+        "MidiDial": [
+            (lambda d=(1 if (i // 50) % 2 == 0 else -1): dial.on_dial_rotate(d), 1) for i in range(events)
+        ],
+    }
+    return scenarios, actions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000, help="events per scenario")
+    parser.add_argument("--async", dest="async_dispatch", action="store_true", help="use background dispatch")
+    parser.add_argument("--backend", choices=("auto", "rtmidi", "inprocess"), default="auto")
+    parser.add_argument("--timeout", type=float, default=0.5, help="seconds to wait for each event's messages")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args()
+
+    plugin_base = stubs.install()
+    MidiManager = plugin_base.midi_manager
+
+    receiver = Receiver()
+    inport = None
+    backend = args.backend
+    with contextlib.redirect_stdout(sys.stderr):
+        if backend in ("auto", "rtmidi"):
+            try:
+                port, inport = open_rtmidi_loopback(receiver)
+                backend = "rtmidi"
+            except Exception as e:
+                if args.backend == "rtmidi":
+                    raise
+                print(f"rtmidi loopback unavailable ({e}), using in-process loopback")
+                backend = "inprocess"
+        if backend == "inprocess":
+            port, inport = open_inprocess_loopback(receiver)
+
+        MidiManager.invalidate_port_cache()
+        MidiManager.set_async_dispatch(args.async_dispatch)
+        scenarios, actions = build_scenarios(plugin_base, MidiManager, port, args.events)
+        receiver.wait_for(1 << 30, 0.2)  # discard anything sent while the actions got ready
+
+        results = dict(run_scenario(name, steps, receiver, args.timeout) for name, steps in scenarios.items())
+
+        for action in actions:
+            action.on_removed_from_cache()
+        MidiManager.close_all_ports()
+        if inport is not None:
+            inport.close()
+
+    output = json.dumps({
+        "backend": backend,
+        "port": port,
+        "async_dispatch": args.async_dispatch,
+        "events": args.events,
+        "scenarios": results,
+    }, indent=2, sort_keys=True)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
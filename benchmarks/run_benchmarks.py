@@ -0,0 +1,273 @@
+"""
+Headless benchmark suite for MidiManager and the plugin actions.
+
+Runs against a stub mido backend and stub StreamController/GTK modules, so it
+needs neither a deck nor MIDI hardware. Results are printed as JSON (and can
+be written to a file) for regression tracking.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--quick] [--output results.json]
+"""
+import argparse
+import contextlib
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import stubs
+
+SCHEMA_VERSION = 1
+MISSING_PORT = "Missing MIDI Port"
+
+
+def _timed(func, count):
+    """Run func(i) count times with the GC disabled and return elapsed seconds."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for i in range(count):
+            func(i)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _best_rate(func, count, repeat):
+    """Best messages/second over `repeat` runs."""
+    return max(count / _timed(func, count) for _ in range(repeat))
+
+
+def _percentiles(samples_ns):
+    samples = sorted(samples_ns)
+    n = len(samples)
+
+    def pick(q):
+        return samples[min(n - 1, int(q * n))] / 1000
+
+    return {
+        "mean_us": statistics.fmean(samples) / 1000,
+        "p50_us": pick(0.50),
+        "p95_us": pick(0.95),
+        "p99_us": pick(0.99),
+        "max_us": samples[-1] / 1000,
+    }
+
+
+def _reset_manager(manager):
+    manager.close_all_ports()
+    manager.invalidate_port_cache()
+    manager.reset_port_backoff()
+
+
+def bench_send_methods(manager, port, count, repeat):
+    """Messages/second through each public send method on a warm port."""
+    cc = manager.compile("control_change", 0, 7)
+    methods = {
+        "send_note_on": lambda i: manager.send_note_on(port, 0, 60, i & 0x7F),
+        "send_note_off": lambda i: manager.send_note_off(port, 0, 60),
+        "send_control_change": lambda i: manager.send_control_change(port, 0, 7, i & 0x7F),
+        "send_program_change": lambda i: manager.send_program_change(port, 0, i & 0x7F),
+        "send_pitchwheel": lambda i: manager.send_pitchwheel(port, 0, (i & 0x3FFF) - 8192),
+        "send_message": lambda i: manager.send_message(port, "control_change", channel=0, control=7, value=i & 0x7F),
+        "send_raw": lambda i: manager.send_raw(port, cc.with_value(i)),
+    }
+    manager.send_note_on(port, 0, 60, 0)  # open the port outside the timed loop
+    results = {name: {"msgs_per_s": _best_rate(func, count, repeat)} for name, func in methods.items()}
+
+    # Cost of send statistics on the fast path
+    manager.enable_stats(True)
+    try:
+        results["send_raw_with_stats"] = {"msgs_per_s": _best_rate(methods["send_raw"], count, repeat)}
+    finally:
+        manager.enable_stats(False)
+        manager.reset_stats()
+    return results
+
+
+def bench_dial_rotate(plugin_base, port, count):
+    """Per-event latency of MidiDial.on_dial_rotate and the deck updates it causes.
+
+    Redraws go through the per-deck refresh loop, so deck_updates_per_event
+    reflects the frame-rate cap rather than one redraw per detent.
+    """
+    from midi_plugin.actions.MidiDial.MidiDial import MidiDial
+
+    results = {}
+    for label, coalesce in (("direct", False), ("coalesced", True)):
+        dial = MidiDial(plugin_base=plugin_base, settings={"port": port, "step_size": 1, "coalesce_cc": coalesce})
+        dial.on_ready()
+        dial.settings_writes = dial.deck_updates = 0
+        samples = []
+        gc.collect()
+        gc.disable()
+        try:
+            for i in range(count):
+                # Sweep up and down so the value never sticks at a bound
+                direction = 1 if (i // 100) % 2 == 0 else -1
+                start = time.perf_counter_ns()
+                dial.on_dial_rotate(direction)
+                samples.append(time.perf_counter_ns() - start)
+        finally:
+            gc.enable()
+        result = _percentiles(samples)
+        result["settings_writes_per_event"] = dial.settings_writes / count
+        result["deck_updates_per_event"] = dial.deck_updates / count
+        results[label] = result
+        dial.on_removed_from_cache()
+    return results
+
+
+def bench_page_load(plugin_base, port, count):
+    """Cost of loading a page with `count` MIDI actions: construction plus on_ready.
+
+    Cycles through every registered action type, all configured for the same
+    port, as a large page of keys and dials would.
+    """
+    action_classes = [holder["action_base"] for holder in plugin_base.action_holders]
+    path_entries = len(sys.path)
+    actions = []
+    samples = []
+    gc.collect()
+    gc.disable()
+    try:
+        for i in range(count):
+            action_class = action_classes[i % len(action_classes)]
+            start = time.perf_counter_ns()
+            action = action_class(plugin_base=plugin_base, settings={"port": port})
+            action.on_ready()
+            samples.append(time.perf_counter_ns() - start)
+            actions.append(action)
+    finally:
+        gc.enable()
+    for action in actions:
+        action.on_removed_from_cache()
+    result = _percentiles(samples)
+    result["total_ms"] = sum(samples) / 1e6
+    result["sys_path_added"] = len(sys.path) - path_entries
+    return result
+
+
+def bench_first_press(plugin_base, manager, backend, port, iterations, open_delay=0.005):
+    """First key press after page load vs. the next one, with and without pre-warming.
+
+    The stub backend sleeps open_delay seconds per port open to stand in for
+    ALSA. With pre-warming the port is opened while on_ready runs, so the
+    first press should cost the same as the steady-state one.
+    """
+    from midi_plugin.actions.SendMidiCommand.SendMidiCommand import SendMidiCommand
+
+    backend.configure(open_delay=open_delay)
+    results = {}
+    try:
+        for label, prewarm in (("prewarm", True), ("no_prewarm", False)):
+            manager.set_prewarm(prewarm)
+            first, steady = [], []
+            for _ in range(iterations):
+                _reset_manager(manager)
+                action = SendMidiCommand(plugin_base=plugin_base, settings={
+                    "port": port, "msg_type": "control_change", "data1": 7, "data2": 64,
+                })
+                action.on_ready()
+                # The deck needs a while to draw the page before the first input arrives
+                manager.wait_prewarm()
+                for samples in (first, steady):
+                    start = time.perf_counter_ns()
+                    action.on_key_down()
+                    samples.append(time.perf_counter_ns() - start)
+                action.on_removed_from_cache()
+            results[label] = {"first": _percentiles(first), "steady": _percentiles(steady)}
+    finally:
+        manager.set_prewarm(True)
+        backend.configure()
+    return results
+
+
+def bench_cold_open(manager, backend, port, iterations):
+    """Cost of the first send on a port that is not open yet."""
+    samples = []
+    backend.reset_stats()
+    for _ in range(iterations):
+        _reset_manager(manager)
+        start = time.perf_counter_ns()
+        manager.send_control_change(port, 0, 7, 0)
+        samples.append(time.perf_counter_ns() - start)
+    result = _percentiles(samples)
+    result["enumerations_per_open"] = backend.stats["enumerations"] / iterations
+    return result
+
+
+def bench_missing_port(manager, backend, count):
+    """Send rate and backend load while the configured port is absent."""
+    _reset_manager(manager)
+    backend.reset_stats()
+    elapsed = _timed(lambda i: manager.send_control_change(MISSING_PORT, 0, 7, i & 0x7F), count)
+    return {
+        "msgs_per_s": count / elapsed,
+        "enumerations": backend.stats["enumerations"],
+        "suppressed_sends": manager.get_suppressed_count(MISSING_PORT),
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=stubs.REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for smoke runs")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    args = parser.parse_args()
+
+    count, repeat, events, opens, page = (20_000, 3, 5_000, 200, 500)
+    if args.quick:
+        count, repeat, events, opens, page = (2_000, 1, 500, 20, 50)
+
+    plugin_base = stubs.install()
+    import stub_backend
+    MidiManager = plugin_base.midi_manager
+
+    port = stub_backend.DEFAULT_PORT
+    results = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "count": count,
+            "repeat": repeat,
+        },
+        "benchmarks": {},
+    }
+    benchmarks = results["benchmarks"]
+    # Plugin log output goes to stderr so stdout stays valid JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        benchmarks["send_methods"] = bench_send_methods(MidiManager, port, count, repeat)
+        benchmarks["missing_port"] = bench_missing_port(MidiManager, stub_backend, count)
+        benchmarks["cold_open"] = bench_cold_open(MidiManager, stub_backend, port, opens)
+        benchmarks["first_press"] = bench_first_press(plugin_base, MidiManager, stub_backend, port, opens // 4)
+        _reset_manager(MidiManager)
+        benchmarks["dial_rotate"] = bench_dial_rotate(plugin_base, port, events)
+        benchmarks["page_load"] = bench_page_load(plugin_base, port, page)
+        MidiManager.close_all_ports()
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Stub mido backend for headless benchmarks.
+
+Select it with mido.set_backend("stub_backend", load=True). Output ports look
+like mido's rtmidi ports (they expose _rt and _send_lock) but discard what is
+sent. Enumeration and open costs can be simulated with configure().
+"""
+import threading
+import time
+
+from mido.ports import BaseInput, BaseOutput
+
+DEFAULT_PORT = "Stub MIDI Out"
+
+_port_names = [DEFAULT_PORT]
+_enumerate_delay = 0.0
+_open_delay = 0.0
+
+stats = {"enumerations": 0, "opens": 0, "messages": 0}
+
+
+def configure(port_names=None, enumerate_delay=0.0, open_delay=0.0):
+    """Set the visible output ports and the simulated backend costs (seconds)."""
+    global _port_names, _enumerate_delay, _open_delay
+    _port_names = list(port_names) if port_names is not None else [DEFAULT_PORT]
+    _enumerate_delay = enumerate_delay
+    _open_delay = open_delay
+
+
+def reset_stats():
+    for key in stats:
+        stats[key] = 0
+
+
+def get_devices(**kwargs):
+    stats["enumerations"] += 1
+    if _enumerate_delay:
+        time.sleep(_enumerate_delay)
+    return [{"name": name, "is_input": False, "is_output": True} for name in _port_names]
+
+
+class _StubMidiOut:
+    """Stands in for rtmidi.MidiOut."""
+
+    def send_message(self, data):
+        stats["messages"] += 1
+
+    def close_port(self):
+        pass
+
+
+class Output(BaseOutput):
+    def _open(self, **kwargs):
+        if self.name not in _port_names:
+            raise IOError(f"unknown port {self.name!r}")
+        stats["opens"] += 1
+        if _open_delay:
+            time.sleep(_open_delay)
+        self._rt = _StubMidiOut()
+        self._send_lock = threading.RLock()
+
+    def _close(self):
+        self._rt.close_port()
+
+    def send(self, msg):
+        with self._send_lock:
+            self._rt.send_message(msg.bytes())
+
+
+class Input(BaseInput):
+    def _open(self, **kwargs):
+        raise IOError("the stub backend has no inputs")
@@ -0,0 +1,209 @@
+"""
+Minimal stand-ins for the StreamController host API, GTK and the mido backend.
+
+install() registers the stub modules and loads the plugin package as
+PACKAGE, the way StreamController does, so the actions can be imported from
+it and driven headless. It returns the MidiPlugin to construct actions with.
+The GTK stubs are only created when something imports them; their names are
+appended to ui_imports, so a benchmark can tell whether GTK would be loaded.
+"""
+import importlib.abc
+import importlib.util
+import json
+import os
+import sys
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Name the plugin package is imported under, e.g. midi_plugin.actions.MidiDial.MidiDial
+PACKAGE = "midi_plugin"
+
+
+class StubLocaleManager:
+    def __init__(self, path):
+        with open(path, encoding="utf-8") as f:
+            self._strings = json.load(f)
+
+    def get(self, key):
+        return self._strings.get(key, key)
+
+
+class StubPluginBase:
+    PATH = REPO_ROOT
+
+    def __init__(self):
+        self.locale_manager = StubLocaleManager(os.path.join(REPO_ROOT, "locales", "en_US.json"))
+        self.action_holders = []
+        self.signal_callbacks = []
+
+    def connect(self, signal=None, callback=None):
+        self.signal_callbacks.append((signal, callback))
+
+    def add_action_holder(self, holder):
+        self.action_holders.append(holder)
+
+    def register(self, **kwargs):
+        pass
+
+
+class StubActionBase:
+    """Records settings writes and deck updates instead of touching a deck."""
+
+    def __init__(self, plugin_base=None, settings=None, **kwargs):
+        self.plugin_base = plugin_base
+        self._settings = dict(settings or {})
+        self.settings_writes = 0
+        self.deck_updates = 0
+        self.errors = 0
+
+    def get_settings(self):
+        # StreamController hands out the page's settings dict; copy to mimic the cost
+        return dict(self._settings)
+
+    def set_settings(self, settings):
+        self._settings = dict(settings)
+        self.settings_writes += 1
+
+    def _deck_update(self, *args, **kwargs):
+        self.deck_updates += 1
+
+    set_media = _deck_update
+    set_top_label = _deck_update
+    set_center_label = _deck_update
+    set_bottom_label = _deck_update
+    set_dial_indicator = _deck_update
+
+    def show_error(self, duration=-1):
+        self.errors += 1
+
+    def hide_error(self):
+        pass
+
+    def connect(self, signal=None, callback=None):
+        pass
+
+    def clear_event_assigners(self):
+        pass
+
+    def add_event_assigner(self, assigner):
+        pass
+
+    def on_removed_from_cache(self):
+        pass
+
+
+class _Anything:
+    """Attribute sink used for GTK and enum-like namespaces."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+    def __iter__(self):
+        return iter(())
+
+    # Widget getters return _Anything; numeric use reads as 0
+    def __int__(self):
+        return 0
+
+    __float__ = __int__
+
+    def __lt__(self, other):
+        return False
+
+    __gt__ = __le__ = __ge__ = __lt__
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+# Names of the GTK-side modules imported so far, in import order
+ui_imports = []
+
+
+def _ui_module_attrs():
+    repository = {"Gtk": _Anything(), "Adw": _Anything(), "Gdk": _Anything(), "GLib": _Anything()}
+    return {
+        "gi": {"require_version": lambda *args: None},
+        "gi.repository": repository,
+        "GtkHelper": {},
+        "GtkHelper.GtkHelper": {"ComboRow": _Anything},
+    }
+
+
+class _UIStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Creates the gi/GtkHelper stubs on first import and records the import."""
+
+    def __init__(self, names):
+        self._attrs = {name: attrs for name, attrs in _ui_module_attrs().items() if name in names}
+
+    def find_spec(self, name, path=None, target=None):
+        if name in self._attrs:
+            return importlib.util.spec_from_loader(name, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        module.__dict__.update(self._attrs[module.__name__])
+        ui_imports.append(module.__name__)
+
+
+def load_plugin():
+    """Import the repository as PACKAGE and return a new MidiPlugin."""
+    if PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE, os.path.join(REPO_ROOT, "__init__.py"), submodule_search_locations=[REPO_ROOT]
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE] = package
+        spec.loader.exec_module(package)
+    main = importlib.import_module(f"{PACKAGE}.main")
+    return main.MidiPlugin()
+
+
+def install(port_names=None, enumerate_delay=0.0, open_delay=0.0, real_gi=False, plugin=True):
+    """Install all stubs, select the stub mido backend and load the plugin.
+
+    Args:
+        real_gi (bool): Use the installed PyGObject instead of the gi stub, if available.
+        plugin (bool): Load the plugin and return it; otherwise return None.
+    """
+    benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+    if benchmarks_dir not in sys.path:
+        sys.path.insert(0, benchmarks_dir)
+
+    _module("src")
+    _module("src.backend")
+    _module("src.backend.PluginManager")
+    _module("src.backend.PluginManager.ActionBase", ActionBase=StubActionBase)
+    _module("src.backend.PluginManager.PluginBase", PluginBase=StubPluginBase)
+    _module("src.backend.PluginManager.EventAssigner", EventAssigner=lambda **kwargs: kwargs)
+    _module("src.backend.PluginManager.ActionHolder", ActionHolder=lambda **kwargs: kwargs)
+    _module("src.backend.PluginManager.ActionInputSupport", ActionInputSupport=_Anything())
+    _module("src.backend.DeckManagement")
+    _module("src.backend.DeckManagement.InputIdentifier", Input=_Anything())
+    signals = _module("src.Signals.Signals", ChangePage=object(), AppQuit=object())
+    _module("src.Signals", Signals=signals)
+
+    ui_stubs = {"GtkHelper", "GtkHelper.GtkHelper"}
+    if not (real_gi and importlib.util.find_spec("gi") is not None):
+        ui_stubs |= {"gi", "gi.repository"}
+    if not any(isinstance(finder, _UIStubFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _UIStubFinder(ui_stubs))
+
+    import mido
+    import stub_backend
+    stub_backend.configure(port_names, enumerate_delay, open_delay)
+    mido.set_backend("stub_backend", load=True)
+    return load_plugin() if plugin else None
@@ -0,0 +1,125 @@
+"""
+ActionConfig - Typed snapshots of action settings for the event hot path.
+"""
+
+
+class _ConfigMeta(type):
+    """Gives each config class __slots__ named after its DEFAULTS.
+
+    Slots have to exist when the class is created, which is too early for
+    __init_subclass__, so this is done by the metaclass.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        namespace.setdefault("__slots__", tuple(namespace.get("DEFAULTS", ())))
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class ActionConfig(metaclass=_ConfigMeta):
+    """Attribute view of an action's settings, built once per settings change.
+
+    Subclasses list their settings and defaults in DEFAULTS; the names become
+    __slots__. Reading an attribute replaces the get_settings() copy plus dict
+    lookups that an input event would otherwise do. The snapshot is never
+    written to; handlers save the settings and build a new one.
+    """
+
+    __slots__ = ("port",)
+    DEFAULTS = {}
+
+    def __init__(self, settings=None):
+        settings = settings or {}
+        self.port = settings.get("port", "")
+        for name, default in self.DEFAULTS.items():
+            setattr(self, name, settings.get(name, default))
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in ("port", *self.DEFAULTS))
+        return f"{type(self).__name__}({fields})"
+
+
+class ConfigMixin:
+    """Settings snapshot handling shared by the MIDI actions.
+
+    Mix in before ActionBase and set _config_class to the action's
+    ActionConfig subclass. Actions that derive more state from the settings
+    override _save_config and call super().
+    """
+
+    _config_class = ActionConfig
+
+    def _build_config(self, settings) -> None:
+        """Rebuild the settings snapshot read by the event handlers."""
+        self._config = self._config_class(settings)
+
+    def _save_config(self, settings) -> None:
+        """Save changed settings and refresh the snapshot."""
+        self.set_settings(settings)
+        self._build_config(settings)
+
+    def _ensure_default_settings(self):
+        """Ensure settings have default values."""
+        settings = self.get_settings()
+        changed = False
+        for key, default in self._config_class.DEFAULTS.items():
+            if key not in settings:
+                settings[key] = default
+                changed = True
+        if changed:
+            self.set_settings(settings)
+
+
+class SendNoteConfig(ActionConfig):
+    DEFAULTS = {
+        "channel": 0,
+        "note": 60,
+        "velocity": 100,
+    }
+
+
+class SendMidiCommandConfig(ActionConfig):
+    DEFAULTS = {
+        "msg_type": "note_on",
+        "channel": 0,
+        "data1": 60,
+        "data2": 100,
+        "bank": -1,
+    }
+
+
+class MidiDialConfig(ActionConfig):
+    DEFAULTS = {
+        "channel": 0,
+        "cc_number": 7,  # Volume
+        "step_size": 4,
+        "default_value": 64,
+        "min_value": 0,
+        "max_value": 127,
+        "press_action": "mute",
+        "display_mode": "value",
+        "send_on_ready": False,
+        "coalesce_cc": True,
+        "max_rate": 100,
+        "persist_delay_ms": 500,
+        "display_fps": 30,
+        "resolution": "7bit",
+        "param_number": 0,
+        "acceleration": "off",
+        "acceleration_max": 8,
+        "acceleration_decay_ms": 150,
+    }
+
+
+class SendSequenceConfig(ActionConfig):
+    DEFAULTS = {
+        "steps": "0 note_on 0 60 100; 250 note_off 0 60",
+        "unit": "ms",
+        "bpm": 120,
+    }
+
+
+class SendClockConfig(ActionConfig):
+    DEFAULTS = {
+        "bpm": 120,
+        "resume": False,
+    }
@@ -0,0 +1,93 @@
+"""
+CCCoalescer - Rate-limits bursts of value updates, keeping only the latest.
+"""
+import threading
+import time
+
+
+class CCCoalescer:
+    """Coalesces rapid value updates per key and emits them at a maximum rate.
+
+    The first update after an idle period is emitted immediately. Updates that
+    arrive within the rate-limit interval replace each other, and the latest one
+    is emitted when the interval expires, so the final value is always delivered.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = {}    # key -> (value, emit, args)
+        self._due = {}        # key -> monotonic time the pending value is due
+        self._last_emit = {}  # key -> monotonic time of the last emission
+        self._thread = None
+
+    def submit(self, key, value, emit, max_rate, args=()):
+        """Submit a new value for a key.
+
+        Args:
+            key: Hashable identifier, e.g. (port_name, channel, control).
+            value: The latest target value.
+            emit (callable): Called as emit(*args, value) to deliver the value.
+            max_rate (float): Maximum emissions per second for this key.
+            args (tuple): Leading arguments for emit, so callers need no closure per value.
+        """
+        interval = 1.0 / max(1.0, float(max_rate))
+        now = time.monotonic()
+        with self._cond:
+            last = self._last_emit.get(key)
+            if key not in self._due and (last is None or now - last >= interval):
+                self._last_emit[key] = now
+                emit_now = True
+            else:
+                self._pending[key] = (value, emit, args)
+                if key not in self._due:
+                    self._due[key] = last + interval
+                    self._ensure_thread()
+                    self._cond.notify()
+                emit_now = False
+        if emit_now:
+            emit(*args, value)
+
+    def flush(self):
+        """Immediately emit all pending values."""
+        with self._cond:
+            pending = list(self._pending.values())
+            now = time.monotonic()
+            for key in self._pending:
+                self._last_emit[key] = now
+            self._pending.clear()
+            self._due.clear()
+        for value, emit, args in pending:
+            self._emit(value, emit, args)
+
+    def _ensure_thread(self):
+        """Start the emitter thread if needed. Must hold self._cond."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="MidiCCCoalescer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Emit pending values as their intervals expire."""
+        while True:
+            with self._cond:
+                while not self._due:
+                    self._cond.wait()
+                now = time.monotonic()
+                next_due = min(self._due.values())
+                if next_due > now:
+                    self._cond.wait(next_due - now)
+                    continue
+                ready = []
+                for key, due in list(self._due.items()):
+                    if due <= now:
+                        del self._due[key]
+                        ready.append(self._pending.pop(key))
+                        self._last_emit[key] = now
+            for value, emit, args in ready:
+                self._emit(value, emit, args)
+
+    @staticmethod
+    def _emit(value, emit, args):
+        try:
+            emit(*args, value)
+        except Exception as e:
+            print(f"Error emitting coalesced value: {e}")
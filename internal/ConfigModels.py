@@ -0,0 +1,97 @@
+"""
+ConfigModels - Gtk models shared by the config panels of all actions.
+
+Only imported from the actions' UI modules, so GTK is still loaded on first use.
+"""
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+
+class ChoiceModel:
+    """A Gtk.ListStore of (label, value) rows with a value -> row index map."""
+
+    __slots__ = ("store", "options", "_index")
+
+    def __init__(self, options, value_type=str):
+        self.store = Gtk.ListStore(str, value_type)
+        self.options = ()
+        self._index = {}
+        self.fill(options)
+
+    def fill(self, options):
+        """Replace the rows, keeping the same store so existing combo boxes see the change."""
+        options = tuple(options)
+        self.store.clear()
+        for label, value in options:
+            self.store.append([label, value])
+        self.options = options
+        # The first row wins if a value is listed twice
+        self._index = {}
+        for i, (_, value) in enumerate(options):
+            self._index.setdefault(value, i)
+
+    def index_of(self, value, default=0):
+        """Row index of value, for combo_box.set_active."""
+        return self._index.get(value, default)
+
+
+class ConfigModels:
+    """Builds each config model once per locale and shares it between panels.
+
+    Models are keyed by name and their labels are only built again when the
+    language was switched, so reopening a panel costs no locale lookups. The
+    port model is backed by MidiManager's port directory and is refilled in
+    place only when the port list changed. All methods are called from the
+    GTK main thread.
+    """
+
+    _choices = {}  # name -> (locale key, ChoiceModel)
+    _ports = None
+
+    @classmethod
+    def choices(cls, name, action, build_options, value_type=str):
+        """Return the shared ChoiceModel for [(label, value)] options.
+
+        Args:
+            name (str): Model name, unique per set of options.
+            action: The action whose plugin's locale the labels are in.
+            build_options (callable): Returns the options; only called when the
+                model does not exist yet or the language changed.
+            value_type: Type of the value column.
+        """
+        locale_manager = getattr(action.plugin_base, "locale_manager", None)
+        locale_key = (id(locale_manager), getattr(locale_manager, "language", None))
+        cached = cls._choices.get(name)
+        if cached is not None and cached[0] == locale_key:
+            return cached[1]
+        options = tuple(build_options())
+        if cached is None:
+            model = ChoiceModel(options, value_type)
+        else:
+            model = cached[1]
+            if model.options != options:
+                model.fill(options)
+        cls._choices[name] = (locale_key, model)
+        return model
+
+    @classmethod
+    def ports(cls, midi_manager, no_ports_label, rescan=False):
+        """Return the shared port ChoiceModel, with the port name as label and value.
+
+        Args:
+            midi_manager: The plugin's MidiManager, or None.
+            no_ports_label (str): Row shown when no port is available.
+            rescan (bool): Re-enumerate the ports and retry ports that are backing off.
+        """
+        names = []
+        if midi_manager:
+            if rescan:
+                midi_manager.reset_port_backoff()
+            names = midi_manager.get_output_ports(refresh=rescan)
+        options = [(name, name) for name in names or [no_ports_label]]
+        if cls._ports is None:
+            cls._ports = ChoiceModel(options)
+        elif cls._ports.options != tuple(options):
+            cls._ports.fill(options)
+        return cls._ports
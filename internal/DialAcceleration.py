@@ -0,0 +1,70 @@
+"""
+DialAcceleration - Turn-speed dependent step sizes for dials.
+"""
+import math
+import time
+
+# Exponent applied to the speed above the threshold, per curve setting
+CURVES = {
+    "linear": 1.0,
+    "quadratic": 2.0,
+}
+
+
+class DialAccelerator:
+    """Scales a dial's step size by how fast it is being turned.
+
+    The turn speed (detents per second) is estimated from the interval between
+    detents and smoothed with an exponential decay, so a single quick detent
+    does not jump and the speed falls off once the dial slows down. Below
+    SLOW_SPEED the step is unchanged, which keeps full resolution for slow
+    turns; above it the gain grows along the selected curve, up to max_gain.
+    Reversing direction drops back to the base step.
+    """
+
+    __slots__ = ("_speed", "_last_time", "_last_sign")
+
+    # Detents per second up to which no acceleration is applied
+    SLOW_SPEED = 5.0
+    # Speed above SLOW_SPEED that adds a gain of 1
+    SPEED_UNIT = 10.0
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._speed = 0.0
+        self._last_time = None
+        self._last_sign = 0
+
+    def step(self, direction, step_size, curve="linear", max_gain=8.0, decay_ms=150, now=None):
+        """Return the signed value change for a rotation event.
+
+        Args:
+            direction (int): Detents turned, negative for counter-clockwise.
+            step_size (int): The change per detent when turning slowly.
+            curve (str): 'linear' or 'quadratic'.
+            max_gain (float): Upper bound for the step multiplier.
+            decay_ms (float): Smoothing time constant for the speed estimate.
+            now (float): Event time (time.monotonic()), mainly for testing.
+        """
+        if now is None:
+            now = time.monotonic()
+        sign = 1 if direction > 0 else -1 if direction < 0 else 0
+        detents = abs(direction)
+
+        if self._last_time is None or sign != self._last_sign:
+            self._speed = 0.0
+        else:
+            interval = max(now - self._last_time, 1e-3)
+            rate = detents / interval
+            alpha = 1.0 - math.exp(-interval / max(decay_ms / 1000, 1e-3))
+            self._speed += alpha * (rate - self._speed)
+        self._last_time = now
+        self._last_sign = sign
+
+        gain = 1.0
+        excess = self._speed - self.SLOW_SPEED
+        if excess > 0:
+            gain = min(float(max_gain), 1.0 + (excess / self.SPEED_UNIT) ** CURVES.get(curve, 1.0))
+        return sign * max(1, round(detents * step_size * gain))
@@ -0,0 +1,131 @@
+"""
+DisplayRefresher - Frame-rate capped redraws, decoupled from input events.
+"""
+import threading
+import time
+import weakref
+
+
+class _Entry:
+    __slots__ = ("render", "interval", "dirty")
+
+    def __init__(self, render, interval):
+        self.render = render
+        self.interval = interval
+        self.dirty = False
+
+
+class DisplayRefresher:
+    """Per-deck refresh loop.
+
+    Actions mark themselves dirty on every state change; the loop draws frames
+    at most `fps` times per second per deck, and each frame renders every dirty
+    action with its latest state. When actions ask for different rates the
+    lowest one is used, so the deck never exceeds any action's cap. One loop
+    exists per deck; its thread runs while the deck has live actions and is
+    started again by the next mark_dirty after it stopped.
+    """
+
+    # How long an idle loop waits before checking whether its actions are gone
+    IDLE_TIMEOUT = 5.0
+
+    # Held weakly, so a discarded deck does not keep its refresher
+    _instances = weakref.WeakKeyDictionary()
+    _default = None
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_deck(cls, deck):
+        """Return the refresher shared by all actions on a deck."""
+        with cls._instances_lock:
+            if deck is None:
+                if cls._default is None:
+                    cls._default = cls("MidiDisplay")
+                return cls._default
+            refresher = cls._instances.get(deck)
+            if refresher is None:
+                refresher = cls(f"MidiDisplay-{id(deck)}")
+                cls._instances[deck] = refresher
+            return refresher
+
+    def __init__(self, name):
+        self._name = name
+        self._cond = threading.Condition()
+        self._entries = {}
+        self._frame_interval = 0.0
+        self._last_frame = 0.0
+        self._thread = None
+
+    def mark_dirty(self, render, fps=30):
+        """Schedule a redraw in the next frame.
+
+        Args:
+            render (callable): Bound method that draws the current state.
+                It is held weakly, so discarded actions drop out automatically.
+            fps (float): Maximum frames per second this action asks for.
+        """
+        key = (id(render.__self__), render.__func__)
+        interval = 1.0 / max(1.0, float(fps))
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is None or entry.render() is None:
+                # Forget actions that were discarded since the last registration
+                self._drop_discarded()
+                entry = _Entry(weakref.WeakMethod(render), interval)
+                self._entries[key] = entry
+                self._update_frame_interval()
+            elif entry.interval != interval:
+                entry.interval = interval
+                self._update_frame_interval()
+            if not entry.dirty:
+                entry.dirty = True
+                self._cond.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+
+    def _drop_discarded(self):
+        """Remove entries whose action was garbage-collected. Must hold self._cond."""
+        for key in [k for k, e in self._entries.items() if e.render() is None]:
+            del self._entries[key]
+
+    def _update_frame_interval(self):
+        """Use the longest interval any action asked for. Must hold self._cond."""
+        self._frame_interval = max((e.interval for e in self._entries.values()), default=0.0)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                dirty = [(key, entry) for key, entry in self._entries.items() if entry.dirty]
+                if not dirty:
+                    if not self._cond.wait(self.IDLE_TIMEOUT):
+                        # Stop the thread once every action on the deck is gone
+                        self._drop_discarded()
+                        self._update_frame_interval()
+                        if not self._entries:
+                            self._thread = None
+                            return
+                    continue
+                now = time.monotonic()
+                next_frame = self._last_frame + self._frame_interval
+                if next_frame > now:
+                    self._cond.wait(next_frame - now)
+                    continue
+                self._last_frame = now
+                due = []
+                for key, entry in dirty:
+                    entry.dirty = False
+                    due.append((key, entry.render))
+            for key, ref in due:
+                render = ref()
+                if render is None:
+                    with self._cond:
+                        if self._entries.pop(key, None) is not None:
+                            self._update_frame_interval()
+                    continue
+                try:
+                    render()
+                except Exception as e:
+                    print(f"Error refreshing display: {e}")
+            # Drop the last bound method so an idle loop does not keep its action alive
+            render = due = None
@@ -0,0 +1,196 @@
+"""
+MidiClock - Drift-free 24 PPQN MIDI clock generator.
+"""
+import os
+import threading
+import time
+
+from .MidiManager import MidiManager
+from .MidiStats import LatencyHistogram
+
+# System real-time status bytes
+CLOCK = (0xF8,)
+START = (0xFA,)
+CONTINUE = (0xFB,)
+STOP = (0xFC,)
+
+PPQN = 24
+
+
+class MidiClock:
+    """Sends MIDI timing clock to one output port from a dedicated thread.
+
+    Tick n is due at anchor + n * period on the monotonic clock, so timing
+    errors never accumulate; a tempo change re-anchors at the next tick. The
+    thread sleeps until shortly before each deadline and spins for the rest,
+    and writes the port directly so queued traffic from other actions cannot
+    delay a tick. How late each tick was written (after the write returned)
+    is kept as jitter stats, next to how late the thread started the write.
+    """
+
+    # How long before a tick to stop sleeping and start spinning
+    SPIN_MARGIN = 0.001
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_port(cls, port_name):
+        """Return the clock for a port; all actions on that port share it."""
+        with cls._instances_lock:
+            clock = cls._instances.get(port_name)
+            if clock is None:
+                clock = cls(port_name)
+                cls._instances[port_name] = clock
+            return clock
+
+    @classmethod
+    def stop_all(cls):
+        """Stop every running clock, e.g. when the application quits."""
+        with cls._instances_lock:
+            clocks = list(cls._instances.values())
+        for clock in clocks:
+            clock.stop()
+
+    def __init__(self, port_name):
+        self.port_name = port_name
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._bpm = 120.0
+        self._tempo_changed = False
+        self._lateness = LatencyHistogram()
+        self._wake_lateness = LatencyHistogram()
+        self._ticks = 0
+        self._skipped = 0
+
+    @property
+    def running(self):
+        return self._running
+
+    @property
+    def bpm(self):
+        return self._bpm
+
+    def start(self, bpm=None, resume=False):
+        """Start sending clock, preceded by Start (or Continue when resuming)."""
+        with self._cond:
+            if bpm is not None:
+                self._bpm = float(bpm)
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, args=(CONTINUE if resume else START,),
+                name=f"MidiClock-{self.port_name}", daemon=True,
+            )
+            # Keep the port open while the clock runs, even if no action watches it
+            MidiManager.watch_port(self.port_name, self._on_port_status)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the clock and send Stop once the clock thread has finished."""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            thread = self._thread
+            self._thread = None
+            self._cond.notify()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        MidiManager.send_realtime(self.port_name, STOP)
+        MidiManager.unwatch_port(self.port_name, self._on_port_status)
+
+    def set_bpm(self, bpm):
+        """Change the tempo; a running clock switches over at its next tick."""
+        with self._cond:
+            self._bpm = float(bpm)
+            self._tempo_changed = True
+            self._cond.notify()
+
+    def get_stats(self):
+        """Return tick counts and the tick lateness histograms.
+
+        'lateness' is measured after each write returned, so it includes the
+        backend's write time; 'wake_lateness' is measured just before the write.
+        """
+        with self._cond:
+            return {
+                "running": self._running,
+                "bpm": self._bpm,
+                "ticks": self._ticks,
+                "skipped": self._skipped,
+                "lateness": self._lateness.to_dict(),
+                "wake_lateness": self._wake_lateness.to_dict(),
+            }
+
+    def reset_stats(self):
+        with self._cond:
+            self._lateness = LatencyHistogram()
+            self._wake_lateness = LatencyHistogram()
+            self._ticks = 0
+            self._skipped = 0
+
+    def _on_port_status(self, port_name, available):
+        # Sends simply fail while the port is gone; the clock keeps its timeline
+        pass
+
+    @staticmethod
+    def _raise_priority():
+        """Best effort: a higher nice value for this thread.
+
+        Real-time scheduling is not used: together with the final spin it could
+        starve every other thread on a single core.
+        """
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -10)
+        except (AttributeError, OSError):
+            pass
+
+    def _run(self, first_message):
+        self._raise_priority()
+        send = MidiManager.send_realtime
+        monotonic = time.monotonic
+
+        with self._cond:
+            period = 60.0 / (self._bpm * PPQN)
+            self._tempo_changed = False
+        anchor = monotonic()
+        tick = 0
+        send(self.port_name, first_message)
+
+        while True:
+            deadline = anchor + tick * period
+            with self._cond:
+                if not self._running:
+                    return
+                if self._tempo_changed:
+                    # Re-anchor on the next tick so the new period applies from there
+                    self._tempo_changed = False
+                    anchor, tick = deadline, 0
+                    period = 60.0 / (self._bpm * PPQN)
+                remaining = deadline - monotonic()
+                if remaining > self.SPIN_MARGIN:
+                    self._cond.wait(remaining - self.SPIN_MARGIN)
+                    continue
+
+            while monotonic() < deadline:
+                pass
+
+            late = monotonic() - deadline
+            if late > PPQN * period:
+                # More than a beat behind (e.g. after a suspend): skip ahead instead of bursting
+                missed = int(late / period)
+                with self._cond:
+                    self._skipped += missed
+                tick += missed
+                continue
+
+            send(self.port_name, CLOCK)
+            written = monotonic() - deadline
+            with self._cond:
+                self._ticks += 1
+                self._lateness.record(int(written * 1e9))
+                self._wake_lateness.record(int(late * 1e9))
+            tick += 1
@@ -1,22 +1,159 @@
 """
 MidiManager - Handles MIDI communication.
 """
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import mido
 
+from .CCCoalescer import CCCoalescer
+from .MidiStats import PortStats
+from .MidiTemplate import (
+    CC_DATA_ENTRY_MSB, CC_NRPN_LSB, CC_NRPN_MSB, CC_RPN_LSB, CC_RPN_MSB, HIGH_RES_MAX,
+    HighResEncoder, compile_message,
+)
+
+_perf_ns = time.perf_counter_ns
+
 
 class MidiManager:
     """Static class for managing MIDI connections and sending messages."""
 
+    # Port pool: _pool_lock guards the dicts, per-port locks serialise open/close
     _output_ports = {}
+    _raw_writers = {}
+    _port_locks = {}
+    _pool_lock = threading.Lock()
+    _unreferenced_since = {}
+    _idle_close_delay = 30.0
+
+    # Shared port directory, re-enumerated at most once per TTL
+    _port_names = None
+    _port_names_time = 0.0
+    _port_cache_ttl = 2.0
+    _port_cache_lock = threading.Lock()
+
+    # Negative cache: ports that failed to open are retried with exponential backoff
+    _port_failures = {}
+    _suppressed_sends = {}
+    _backoff_base = 0.5
+    _backoff_max = 30.0
+
+    # Hot-plug monitor: listeners per watched port, notified on (dis)connect
+    _port_watchers = {}
+    _watch_lock = threading.Lock()
+    _monitor_thread = None
+    _monitor_stop = threading.Event()
+    _monitor_interval = 2.0
+    _known_ports = None
+
+    # Pre-warming: ports watched by actions are opened on a small pool at page load
+    _prewarm_enabled = True
+    _prewarm_workers = 4
+    _prewarm_executor = None
+    _prewarm_pending = {}
+    _prewarm_lock = threading.Lock()
+
+    # Background dispatch (opt-in): one bounded queue and worker thread per port
+    _async_dispatch = False
+    _queue_size = 256
+    _send_queues = {}
+    _send_workers = {}
+    _dispatch_lock = threading.Lock()
+    _dropped_messages = {}
+    _STOP = object()
+
+    # Rate-limited Control Change output for fast controls like dials
+    _cc_coalescer = CCCoalescer()
+    # What each receiver last got, so send_high_res only sends what is missing:
+    # MSB and parameter select controllers per (port, status byte, controller),
+    # and the selected NRPN/RPN parameter as (mode, number) per (port, status byte)
+    _high_res_lock = threading.Lock()
+    _receiver_cc = {}
+    _selected_params = {}
+
+    # Last value sent per (port, status byte, controller), to skip redundant Control Changes
+    _last_sent = {}
+    _dedupe_enabled = True
+
+    # Send statistics (opt-in): per-port counters and latency histograms
+    _stats_enabled = False
+    _port_stats = {}
+    _stats_lock = threading.Lock()
+    _stats_dump_thread = None
+    _stats_dump_stop = threading.Event()
+
+    # Set once the plugin has loaded the backend, see initialize()
+    _initialized = False
 
     @classmethod
-    def get_output_ports(cls):
-        """Get list of available MIDI output port names."""
+    def initialize(cls):
+        """Load the mido backend and warm the port directory.
+
+        Called once by the plugin at startup, so neither the backend import nor
+        the first port enumeration is paid for by an action. The backend is the
+        one selected in mido (MIDO_BACKEND or mido.set_backend). Safe to call
+        again; later calls return immediately.
+
+        Returns:
+            bool: True if the backend is loaded.
+        """
+        if cls._initialized:
+            return True
         try:
-            return mido.get_output_names()
+            mido.backend.load()
         except Exception as e:
-            print(f"Error getting MIDI ports: {e}")
-            return []
+            print(f"Failed to load MIDI backend {mido.backend.name}: {e}")
+            return False
+        cls._initialized = True
+        cls.get_output_ports(refresh=True)
+        return True
+
+    @classmethod
+    def get_output_ports(cls, refresh=False):
+        """Get list of available MIDI output port names.
+
+        The list is cached for a short TTL so that many actions opening their
+        configuration or sending at once share a single enumeration.
+
+        Args:
+            refresh (bool): Force a rescan instead of using the cached list.
+        """
+        with cls._port_cache_lock:
+            now = time.monotonic()
+            if (refresh or cls._port_names is None
+                    or now - cls._port_names_time > cls._port_cache_ttl):
+                try:
+                    cls._port_names = list(mido.get_output_names())
+                except Exception as e:
+                    print(f"Error getting MIDI ports: {e}")
+                    cls._port_names = None
+                    return []
+                cls._port_names_time = now
+            return list(cls._port_names)
+
+    @classmethod
+    def invalidate_port_cache(cls):
+        """Force the next port lookup to re-enumerate the system ports."""
+        with cls._port_cache_lock:
+            cls._port_names = None
+
+    @classmethod
+    def set_port_cache_ttl(cls, ttl):
+        """Set how long (in seconds) the enumerated port list stays valid."""
+        cls._port_cache_ttl = max(0.0, float(ttl))
+
+    @classmethod
+    def _get_port_lock(cls, port_name):
+        """Return the lock that serialises opening and closing of one port."""
+        lock = cls._port_locks.get(port_name)
+        if lock is None:
+            with cls._pool_lock:
+                lock = cls._port_locks.setdefault(port_name, threading.Lock())
+        return lock
 
     @classmethod
     def _get_or_create_port(cls, port_name):
@@ -24,49 +161,463 @@ class MidiManager:
         if not port_name:
             return None
 
-        # Check if we have a cached port
-        if port_name in cls._output_ports:
-            port = cls._output_ports[port_name]
-            # Check if the port is still valid
+        # Fast path: an open cached port needs no locking
+        port = cls._output_ports.get(port_name)
+        if port is not None and not getattr(port, "closed", True):
+            return port
+
+        with cls._get_port_lock(port_name):
+            # Another thread may have opened the port while we waited for the lock
+            port = cls._output_ports.get(port_name)
+            if port is not None:
+                try:
+                    if not port.closed:
+                        return port
+                except Exception:
+                    # Port object is invalid, drop it below
+                    pass
+                with cls._pool_lock:
+                    cls._output_ports.pop(port_name, None)
+                    cls._raw_writers.pop(port_name, None)
+                # The device may have been reset or replaced, so nothing counts as sent
+                cls.clear_last_sent(port_name)
+
+            # Skip the lookup entirely while a missing port is backing off
+            failure = cls._port_failures.get(port_name)
+            if failure is not None and time.monotonic() < failure[1]:
+                cls._suppressed_sends[port_name] = cls._suppressed_sends.get(port_name, 0) + 1
+                return None
+
+            # Try to create a new port
             try:
-                if port.closed:
-                    del cls._output_ports[port_name]
-                else:
-                    return port
-            except Exception:
-                # Port object is invalid, remove from cache
-                del cls._output_ports[port_name]
+                # Verify port still exists in system
+                available_ports = cls.get_output_ports()
+                if port_name not in available_ports:
+                    cls._record_port_failure(port_name, f"MIDI port '{port_name}' no longer available")
+                    return None
 
-        # Try to create a new port
-        try:
-            # Verify port still exists in system
-            available_ports = mido.get_output_names()
-            if port_name not in available_ports:
-                print(f"MIDI port '{port_name}' no longer available")
+                port = mido.open_output(port_name)
+            except Exception as e:
+                cls._record_port_failure(port_name, f"Error opening MIDI port {port_name}: {e}")
+                # The cached directory may be stale, rescan on the next attempt
+                cls.invalidate_port_cache()
                 return None
-            
-            cls._output_ports[port_name] = mido.open_output(port_name)
-            return cls._output_ports[port_name]
-        except Exception as e:
-            print(f"Error opening MIDI port {port_name}: {e}")
+
+            with cls._pool_lock:
+                cls._raw_writers[port_name] = cls._make_raw_writer(port)
+                cls._output_ports[port_name] = port
+            if cls._stats_enabled:
+                stats = cls._stats_for(port_name)
+                stats.reopens += 1 if stats.opens else 0
+                stats.opens += 1
+            if cls.get_port_refcount(port_name) == 0:
+                cls._unreferenced_since.setdefault(port_name, time.monotonic())
+
+        cls._clear_port_failure(port_name)
+        return port
+
+    @classmethod
+    def _get_raw_writer(cls, port_name):
+        """Return the raw-bytes writer for a port, opening the port if needed."""
+        if cls._get_or_create_port(port_name) is None:
             return None
+        return cls._raw_writers.get(port_name)
+
+    @staticmethod
+    def _make_raw_writer(port):
+        """Build a function that writes raw message bytes to a port.
+
+        With the rtmidi backend the bytes go straight to the underlying
+        rtmidi.MidiOut, skipping mido.Message construction entirely.
+        """
+        rt = getattr(port, "_rt", None)
+        lock = getattr(port, "_send_lock", None)
+        if rt is not None and lock is not None:
+            send = rt.send_message
+
+            def write(data):
+                with lock:
+                    send(data)
+            return write
+        def write_parsed(data):
+            # parse_all also accepts several concatenated messages (see send_batch)
+            for msg in mido.parse_all(data):
+                port.send(msg)
+        return write_parsed
+
+    @classmethod
+    def _record_port_failure(cls, port_name, message):
+        """Back off further open attempts for a port; only the first failure is logged."""
+        count = cls._port_failures.get(port_name, (0, 0.0))[0] + 1
+        delay = min(cls._backoff_max, cls._backoff_base * (2 ** (count - 1)))
+        cls._port_failures[port_name] = (count, time.monotonic() + delay)
+        if count == 1:
+            print(message)
+
+    @classmethod
+    def _clear_port_failure(cls, port_name):
+        """End a port's backoff, logging how many sends were suppressed while it was missing."""
+        if cls._port_failures.pop(port_name, None) is not None:
+            print(f"MIDI port '{port_name}' reconnected "
+                  f"({cls._suppressed_sends.pop(port_name, 0)} sends suppressed while missing)")
+
+    @classmethod
+    def reset_port_backoff(cls, port_name=None):
+        """Allow an immediate retry of one port, or of all ports if none is given."""
+        for name in list(cls._port_failures) if port_name is None else [port_name]:
+            cls._clear_port_failure(name)
+
+    @classmethod
+    def get_suppressed_count(cls, port_name):
+        """Return how many sends were skipped since the port started backing off."""
+        return cls._suppressed_sends.get(port_name, 0)
 
     @classmethod
     def close_port(cls, port_name):
         """Close a specific MIDI port."""
-        if port_name in cls._output_ports:
-            try:
-                cls._output_ports[port_name].close()
-            except Exception:
-                pass
-            del cls._output_ports[port_name]
+        with cls._get_port_lock(port_name):
+            with cls._pool_lock:
+                port = cls._output_ports.pop(port_name, None)
+                cls._raw_writers.pop(port_name, None)
+                cls._unreferenced_since.pop(port_name, None)
+            if port is not None:
+                try:
+                    port.close()
+                except Exception:
+                    pass
+            cls.clear_last_sent(port_name)
 
     @classmethod
     def close_all_ports(cls):
-        """Close all open MIDI ports."""
+        """Close all open MIDI ports, sending coalesced values and queued messages first."""
+        cls._cc_coalescer.flush()
+        cls.stop_port_monitor()
+        cls._stop_stats_dump()
+        cls.shutdown_dispatch()
+        # A background open still in flight would reopen a port after it was closed
+        with cls._prewarm_lock:
+            executor, cls._prewarm_executor = cls._prewarm_executor, None
+            cls._prewarm_pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
         for port_name in list(cls._output_ports.keys()):
             cls.close_port(port_name)
 
+    @classmethod
+    def watch_port(cls, port_name, callback):
+        """Subscribe to availability changes of a port.
+
+        The callback is called as callback(port_name, available) from the monitor
+        thread whenever the port disappears or reappears. Bound methods are held
+        weakly, so actions do not need to unsubscribe before being discarded.
+        Starts the hot-plug monitor if it is not running yet.
+
+        Returns:
+            bool: Whether the port is currently available.
+        """
+        if not port_name:
+            return False
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        with cls._watch_lock:
+            refs = cls._port_watchers.setdefault(port_name, [])
+            if not any(r() == callback for r in refs):
+                refs.append(ref)
+            cls._unreferenced_since.pop(port_name, None)
+        cls.start_port_monitor()
+        available = port_name in cls.get_output_ports()
+        if available:
+            # Open it while the page loads rather than on the first press
+            cls.prewarm_port(port_name)
+        return available
+
+    @classmethod
+    def unwatch_port(cls, port_name, callback):
+        """Remove a callback registered with watch_port."""
+        with cls._watch_lock:
+            refs = cls._port_watchers.get(port_name, [])
+            refs[:] = [r for r in refs if r() is not None and r() != callback]
+            if not refs:
+                cls._port_watchers.pop(port_name, None)
+                if port_name in cls._output_ports:
+                    cls._unreferenced_since.setdefault(port_name, time.monotonic())
+
+    @classmethod
+    def set_prewarm(cls, enabled):
+        """Enable or disable opening watched ports in the background."""
+        cls._prewarm_enabled = bool(enabled)
+
+    @classmethod
+    def prewarm_port(cls, port_name):
+        """Open a port on the background pool so the first send finds it open.
+
+        watch_port calls this for every action's port from on_ready, so the
+        ports of a page are opened concurrently while it loads. A send that
+        arrives first waits on the port lock instead of opening it again.
+
+        Returns:
+            Future or None: The pending open, None if the port is already open.
+        """
+        if not cls._prewarm_enabled or not port_name:
+            return None
+        port = cls._output_ports.get(port_name)
+        if port is not None and not getattr(port, "closed", True):
+            return None
+        with cls._prewarm_lock:
+            future = cls._prewarm_pending.get(port_name)
+            if future is None:
+                if cls._prewarm_executor is None:
+                    cls._prewarm_executor = ThreadPoolExecutor(
+                        max_workers=cls._prewarm_workers, thread_name_prefix="MidiPrewarm"
+                    )
+                # Stored under the lock, so _prewarm cannot remove it before it is added
+                future = cls._prewarm_executor.submit(cls._prewarm, port_name)
+                cls._prewarm_pending[port_name] = future
+            return future
+
+    @classmethod
+    def _prewarm(cls, port_name):
+        try:
+            return cls._get_or_create_port(port_name) is not None
+        finally:
+            with cls._prewarm_lock:
+                cls._prewarm_pending.pop(port_name, None)
+
+    @classmethod
+    def wait_prewarm(cls, timeout=1.0):
+        """Wait for pending background opens.
+
+        Returns:
+            bool: True if all of them finished within the timeout.
+        """
+        with cls._prewarm_lock:
+            futures = list(cls._prewarm_pending.values())
+        return not wait(futures, timeout=timeout).not_done
+
+    @classmethod
+    def get_port_refcount(cls, port_name):
+        """Return how many live actions currently use (watch) a port."""
+        with cls._watch_lock:
+            return sum(1 for r in cls._port_watchers.get(port_name, ()) if r() is not None)
+
+    @classmethod
+    def set_idle_close_delay(cls, delay):
+        """Set how long (in seconds) an unreferenced port stays open before it is closed."""
+        cls._idle_close_delay = max(0.0, float(delay))
+
+    @classmethod
+    def _close_idle_ports(cls):
+        """Close open ports that no action has referenced for the idle delay."""
+        now = time.monotonic()
+        for port_name in list(cls._output_ports):
+            if cls.get_port_refcount(port_name) > 0:
+                cls._unreferenced_since.pop(port_name, None)
+                continue
+            since = cls._unreferenced_since.setdefault(port_name, now)
+            if now - since >= cls._idle_close_delay:
+                cls.close_port(port_name)
+
+    @classmethod
+    def start_port_monitor(cls, interval=None):
+        """Start the background thread that detects added and removed ports."""
+        if interval is not None:
+            cls._monitor_interval = max(0.1, float(interval))
+        with cls._watch_lock:
+            if cls._monitor_thread is not None and cls._monitor_thread.is_alive():
+                return
+            cls._monitor_stop.clear()
+            cls._monitor_thread = threading.Thread(target=cls._monitor_loop, name="MidiPortMonitor", daemon=True)
+            cls._monitor_thread.start()
+
+    @classmethod
+    def stop_port_monitor(cls):
+        """Stop the hot-plug monitor thread."""
+        cls._monitor_stop.set()
+        thread = cls._monitor_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(cls._monitor_interval + 1.0)
+        cls._monitor_thread = None
+
+    @classmethod
+    def _monitor_loop(cls):
+        cls._known_ports = set(cls.get_output_ports(refresh=True))
+        while not cls._monitor_stop.wait(cls._monitor_interval):
+            try:
+                cls._check_ports()
+                cls._close_idle_ports()
+            except Exception as e:
+                print(f"Error monitoring MIDI ports: {e}")
+
+    @classmethod
+    def _check_ports(cls):
+        """Diff the system ports against the last scan and react to changes."""
+        current = set(cls.get_output_ports(refresh=True))
+        previous = cls._known_ports if cls._known_ports is not None else current
+        cls._known_ports = current
+
+        for port_name in previous - current:
+            # Drop the stale handle so the next send does not write into a dead port
+            cls.close_port(port_name)
+            cls._notify_watchers(port_name, False)
+
+        for port_name in current - previous:
+            with cls._watch_lock:
+                watched = port_name in cls._port_watchers
+            # A device that was (re)plugged starts from its defaults
+            cls.clear_last_sent(port_name)
+            cls.reset_port_backoff(port_name)
+            if watched:
+                # Reopen in the background so the first press is not slowed down
+                cls._get_or_create_port(port_name)
+                cls._notify_watchers(port_name, True)
+
+    @classmethod
+    def _notify_watchers(cls, port_name, available):
+        with cls._watch_lock:
+            refs = cls._port_watchers.get(port_name, [])
+            refs[:] = [r for r in refs if r() is not None]
+            if not refs:
+                cls._port_watchers.pop(port_name, None)
+            callbacks = [r() for r in refs]
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(port_name, available)
+            except Exception as e:
+                print(f"Error notifying port listener: {e}")
+
+    @classmethod
+    def set_async_dispatch(cls, enabled, queue_size=256):
+        """Enable or disable background dispatch of outgoing messages.
+
+        When enabled, sends are placed on a bounded per-port queue and written
+        by a dedicated worker thread, so callers never wait on backend I/O.
+
+        Args:
+            enabled (bool): Whether to dispatch in the background.
+            queue_size (int): Maximum number of pending messages per port.
+        """
+        if not enabled:
+            cls.shutdown_dispatch()
+        cls._queue_size = max(1, int(queue_size))
+        cls._async_dispatch = bool(enabled)
+
+    @classmethod
+    def _enqueue(cls, port_name, data, t_call=0, batch=0):
+        """Queue raw message bytes for the port's worker thread.
+
+        t_call is the perf_counter_ns() of the send call when stats are enabled, else 0.
+        For send_batch, data is a list of messages and batch the number of
+        messages it holds (more than len(data) if they were concatenated).
+
+        Returns:
+            bool: False if the queue was full and the message was dropped.
+        """
+        send_queue = cls._send_queues.get(port_name)
+        if send_queue is None:
+            with cls._dispatch_lock:
+                send_queue = cls._send_queues.get(port_name)
+                if send_queue is None:
+                    send_queue = queue.Queue(maxsize=cls._queue_size)
+                    worker = threading.Thread(
+                        target=cls._send_worker,
+                        args=(port_name, send_queue),
+                        name=f"MidiSend-{port_name}",
+                        daemon=True,
+                    )
+                    cls._send_queues[port_name] = send_queue
+                    cls._send_workers[port_name] = worker
+                    worker.start()
+        t_enqueue = _perf_ns() if t_call else 0
+        try:
+            send_queue.put_nowait((data, batch, t_enqueue))
+        except queue.Full:
+            cls._dropped_messages[port_name] = cls._dropped_messages.get(port_name, 0) + 1
+            cls.clear_last_sent(port_name)
+            return False
+        if t_call:
+            cls._stats_for(port_name).enqueue_latency.record(t_enqueue - t_call)
+        return True
+
+    @classmethod
+    def _send_worker(cls, port_name, send_queue):
+        """Drain a port's queue, writing each message to the port."""
+        while True:
+            item = send_queue.get()
+            if item is cls._STOP:
+                break
+            if isinstance(item, threading.Event):
+                # Flush marker - everything queued before it has been written
+                item.set()
+                continue
+            data, batch, t_enqueue = item
+            writer = cls._get_raw_writer(port_name)
+            if not writer:
+                cls.clear_last_sent(port_name)
+                continue
+            try:
+                if batch:
+                    # Written back-to-back so nothing is interleaved
+                    for message in data:
+                        writer(message)
+                else:
+                    writer(data)
+            except Exception as e:
+                if cls._stats_enabled:
+                    cls._stats_for(port_name).errors += 1
+                print(f"Error sending to {port_name}: {e}")
+                cls.clear_last_sent(port_name)
+                continue
+            if t_enqueue:
+                cls._record_sent(port_name, t_enqueue, batch or 1)
+
+    @classmethod
+    def flush(cls, timeout=1.0):
+        """Block until all messages queued or coalesced so far have been written.
+
+        Args:
+            timeout (float): Maximum seconds to wait per port.
+
+        Returns:
+            bool: True if every queue was drained within the timeout.
+        """
+        cls._cc_coalescer.flush()
+        drained = True
+        with cls._dispatch_lock:
+            queues = list(cls._send_queues.values())
+        for send_queue in queues:
+            marker = threading.Event()
+            try:
+                send_queue.put(marker, timeout=timeout)
+            except queue.Full:
+                drained = False
+                continue
+            if not marker.wait(timeout):
+                drained = False
+        return drained
+
+    @classmethod
+    def shutdown_dispatch(cls, timeout=1.0):
+        """Flush pending messages and stop all worker threads."""
+        cls.flush(timeout)
+        with cls._dispatch_lock:
+            queues = cls._send_queues
+            workers = cls._send_workers
+            cls._send_queues = {}
+            cls._send_workers = {}
+        for send_queue in queues.values():
+            try:
+                send_queue.put(cls._STOP, timeout=timeout)
+            except queue.Full:
+                pass
+        for worker in workers.values():
+            worker.join(timeout)
+
+    @classmethod
+    def get_dropped_count(cls, port_name):
+        """Return how many messages were dropped because the port's queue was full."""
+        return cls._dropped_messages.get(port_name, 0)
+
     @classmethod
     def send_note_on(cls, port_name, channel, note, velocity):
         """Send a MIDI Note On message."""
@@ -78,9 +629,192 @@ class MidiManager:
         cls.send_message(port_name, 'note_off', channel=int(channel), note=int(note), velocity=0)
 
     @classmethod
-    def send_control_change(cls, port_name, channel, control, value):
-        """Send a MIDI Control Change message."""
-        cls.send_message(port_name, 'control_change', channel=int(channel), control=int(control), value=int(value))
+    def set_dedupe(cls, enabled):
+        """Enable or disable skipping of Control Change values that were already sent."""
+        cls._dedupe_enabled = bool(enabled)
+        if not enabled:
+            cls._last_sent.clear()
+
+    @classmethod
+    def clear_last_sent(cls, port_name=None):
+        """Forget the last sent values for one port (or all ports), so they are sent again.
+
+        This includes the selected parameter and MSBs send_high_res assumes the
+        receiver has. Called whenever a send to the port fails or is dropped,
+        since the receiver may then have missed any of them.
+        """
+        with cls._high_res_lock:
+            if port_name is None:
+                cls._last_sent.clear()
+                cls._receiver_cc.clear()
+                cls._selected_params.clear()
+                return
+            for state in (cls._last_sent, cls._receiver_cc, cls._selected_params):
+                for key in [k for k in state if k[0] == port_name]:
+                    state.pop(key, None)
+
+    @classmethod
+    def _record_cc(cls, port_name, data):
+        """Record a Control Change that was written (or queued) for the port."""
+        cls._last_sent[(port_name, data[0], data[1])] = data[2]
+        cls._track_cc(port_name, data)
+
+    @classmethod
+    def _track_cc(cls, port_name, data):
+        """Record raw Control Change bytes sent to a port in the receiver state."""
+        control = data[1]
+        if control < 32 or CC_NRPN_LSB <= control <= CC_RPN_MSB:
+            with cls._high_res_lock:
+                cls._update_receiver(port_name, data[0], control, data[2])
+
+    @classmethod
+    def _update_receiver(cls, port_name, status, control, value):
+        """Apply one Control Change to the receiver state. Must hold _high_res_lock."""
+        cls._receiver_cc[(port_name, status, control)] = value
+        if control < 32:
+            return
+        # A parameter select: Data Entry now refers to a different parameter
+        cls._receiver_cc.pop((port_name, status, CC_DATA_ENTRY_MSB), None)
+        if control <= CC_NRPN_MSB:
+            mode, msb_cc, lsb_cc = "nrpn", CC_NRPN_MSB, CC_NRPN_LSB
+        else:
+            mode, msb_cc, lsb_cc = "rpn", CC_RPN_MSB, CC_RPN_LSB
+        msb = cls._receiver_cc.get((port_name, status, msb_cc))
+        lsb = cls._receiver_cc.get((port_name, status, lsb_cc))
+        if msb is None or lsb is None:
+            cls._selected_params.pop((port_name, status), None)
+        else:
+            cls._selected_params[(port_name, status)] = (mode, (msb << 7) | lsb)
+
+    @classmethod
+    def _is_unchanged(cls, key, value):
+        """Return True if value is the last one sent for key.
+
+        Values are only recorded once they were written or queued, see _record_cc.
+        """
+        return cls._dedupe_enabled and cls._last_sent.get(key) == value
+
+    @classmethod
+    def send_control_change(cls, port_name, channel, control, value, force=False):
+        """Send a MIDI Control Change message.
+
+        Values equal to the last one sent for the same port, channel and
+        controller are skipped unless force is True.
+        """
+        channel, control, value = int(channel), int(control), int(value)
+        if not force and cls._is_unchanged((port_name, 0xB0 | channel, control), value):
+            return
+        cls.send_message(port_name, 'control_change', channel=channel, control=control, value=value)
+
+    @classmethod
+    def send_control_value(cls, port_name, template, value, force=False):
+        """Send a compiled Control Change template with a new value, skipping unchanged values.
+
+        Args:
+            port_name (str): The name of the MIDI output port.
+            template (MessageTemplate): Control Change template from compile().
+            value (int): The control value (0-127).
+            force (bool): Send even if the value equals the last one sent.
+        """
+        data = template.with_value(value)
+        if not force and cls._is_unchanged((port_name, data[0], data[1]), data[2]):
+            return
+        cls.send_raw(port_name, data)
+
+    @classmethod
+    def send_control_change_coalesced(cls, port_name, channel, control, value, max_rate=100, force=False):
+        """Send a Control Change, coalescing bursts to at most max_rate messages per second.
+
+        Only the latest value per (port, channel, control) is kept while rate-limited;
+        the final value is always sent once the interval expires. A value equal
+        to the last one sent is dropped at that point unless force is True.
+        """
+        template = compile_message('control_change', channel, control)
+        cls.send_control_value_coalesced(port_name, template, value, max_rate, force)
+
+    @classmethod
+    def send_control_value_coalesced(cls, port_name, template, value, max_rate=100, force=False):
+        """Send a compiled Control Change template like send_control_change_coalesced.
+
+        Callers that send the same controller repeatedly (e.g. a dial) keep the
+        template from compile() and skip re-validating it on every value.
+        """
+        data = template.data
+        cls._cc_coalescer.submit(
+            (port_name, data[0], data[1]),
+            int(value),
+            cls._emit_control_value,
+            max_rate,
+            (port_name, template, force),
+        )
+
+    @classmethod
+    def _emit_control_value(cls, port_name, template, force, value):
+        """Coalescer callback for send_control_value_coalesced."""
+        cls.send_control_value(port_name, template, value, force)
+
+    @classmethod
+    def high_res_encoder(cls, mode, channel, number):
+        """Create a HighResEncoder for 14-bit CC ('14bit'), NRPN ('nrpn') or RPN ('rpn') values.
+
+        Raises:
+            ValueError: If the mode is unknown or a number is out of range.
+        """
+        return HighResEncoder(mode, channel, number)
+
+    @classmethod
+    def send_high_res(cls, port_name, encoder, value, force=False):
+        """Send a 14-bit value (0-16383) with only the messages the receiver is missing.
+
+        The parameter is only selected when another one was selected since on the
+        same port and channel (by any action), and the MSB is only sent when it
+        differs from the last one the receiver got, so a fine adjustment is a
+        single LSB message.
+
+        Args:
+            port_name (str): The name of the MIDI output port.
+            encoder (HighResEncoder): Encoder from high_res_encoder().
+            value (int): The 14-bit value.
+            force (bool): Send even if the value equals the last one sent.
+        """
+        value = int(value)
+        value = 0 if value < 0 else HIGH_RES_MAX if value > HIGH_RES_MAX else value
+        key = (port_name, encoder.status, encoder.mode, encoder.number)
+        if not force and cls._is_unchanged(key, value):
+            return
+        t_call = _perf_ns() if cls._stats_enabled else 0
+        status = encoder.status
+        msb = value >> 7
+        messages = []
+        with cls._high_res_lock:
+            if encoder.select and cls._selected_params.get((port_name, status)) != (encoder.mode, encoder.number):
+                messages.extend(encoder.select)
+                for data in encoder.select:
+                    cls._update_receiver(port_name, status, data[1], data[2])
+            msb_key = (port_name, status, encoder.msb_cc)
+            if cls._receiver_cc.get(msb_key) != msb:
+                messages.append((status, encoder.msb_cc, msb))
+                cls._receiver_cc[msb_key] = msb
+            messages.append((status, encoder.lsb_cc, value & 0x7F))
+        # On failure _write_batch also forgets the receiver state updated above
+        if cls._write_batch(port_name, messages, len(messages), t_call):
+            cls._last_sent[key] = value
+
+    @classmethod
+    def send_high_res_coalesced(cls, port_name, encoder, value, max_rate=100, force=False):
+        """Send a 14-bit value, coalescing bursts like send_control_change_coalesced."""
+        cls._cc_coalescer.submit(
+            (port_name, encoder.mode, encoder.status, encoder.number),
+            int(value),
+            cls._emit_high_res,
+            max_rate,
+            (port_name, encoder, force),
+        )
+
+    @classmethod
+    def _emit_high_res(cls, port_name, encoder, force, value):
+        """Coalescer callback for send_high_res_coalesced."""
+        cls.send_high_res(port_name, encoder, value, force)
 
     @classmethod
     def send_program_change(cls, port_name, channel, program):
@@ -109,12 +843,236 @@ class MidiManager:
             msg_type (str): The type of MIDI message (e.g., 'note_on', 'control_change').
             **kwargs: Additional arguments for the message (e.g., channel, note, velocity, control, value, program).
         """
-        port = cls._get_or_create_port(port_name)
-        if port:
+        t_call = _perf_ns() if cls._stats_enabled else 0
+        if cls._async_dispatch:
+            if not port_name:
+                return
             try:
-                # Filter out None values from kwargs to avoid mido errors if optional args are passed as None
                 clean_kwargs = {k: v for k, v in kwargs.items() if v is not None}
                 msg = mido.Message(msg_type, **clean_kwargs)
-                port.send(msg)
             except Exception as e:
                 print(f"Error sending {msg_type}: {e}")
+                return
+            data = msg.bytes()
+            if cls._enqueue(port_name, data, t_call) and msg_type == 'control_change':
+                cls._record_cc(port_name, data)
+            return
+
+        port = cls._get_or_create_port(port_name)
+        if not port:
+            cls.clear_last_sent(port_name)
+            return
+        try:
+            # Filter out None values from kwargs to avoid mido errors if optional args are passed as None
+            clean_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+            msg = mido.Message(msg_type, **clean_kwargs)
+        except Exception as e:
+            print(f"Error sending {msg_type}: {e}")
+            return
+        try:
+            port.send(msg)
+        except Exception as e:
+            if t_call:
+                cls._stats_for(port_name).errors += 1
+            print(f"Error sending {msg_type}: {e}")
+            cls.clear_last_sent(port_name)
+            return
+        if msg_type == 'control_change':
+            cls._record_cc(port_name, msg.bytes())
+        if t_call:
+            cls._record_sent(port_name, t_call)
+
+    @classmethod
+    def compile(cls, msg_type, channel, data1=0, data2=0):
+        """Validate and precompile a message for send_raw. See MidiTemplate.compile_message."""
+        return compile_message(msg_type, channel, data1, data2)
+
+    @classmethod
+    def send_raw(cls, port_name, data):
+        """Send already-validated message bytes, e.g. from a compiled MessageTemplate.
+
+        This is the fast path for hot callbacks: no mido.Message is built and no
+        validation is done, so the bytes must come from compile() or equivalent.
+
+        Args:
+            port_name (str): The name of the MIDI output port.
+            data (tuple): Raw message bytes (status byte followed by data bytes).
+        """
+        t_call = _perf_ns() if cls._stats_enabled else 0
+        # Keep the last-sent tracking accurate when Control Changes bypass it
+        is_cc = len(data) == 3 and data[0] & 0xF0 == 0xB0
+        if cls._async_dispatch:
+            if port_name and cls._enqueue(port_name, data, t_call) and is_cc:
+                cls._record_cc(port_name, data)
+            return
+
+        writer = cls._get_raw_writer(port_name)
+        if not writer:
+            cls.clear_last_sent(port_name)
+            return
+        try:
+            writer(data)
+        except Exception as e:
+            if t_call:
+                cls._stats_for(port_name).errors += 1
+            print(f"Error sending raw message: {e}")
+            cls.clear_last_sent(port_name)
+            return
+        if is_cc:
+            cls._record_cc(port_name, data)
+        if t_call:
+            cls._record_sent(port_name, t_call)
+
+    @classmethod
+    def send_realtime(cls, port_name, data):
+        """Write message bytes to the port immediately, bypassing background dispatch.
+
+        Used for timing-critical traffic such as MIDI clock, which must not wait
+        behind messages queued by other actions.
+
+        Args:
+            port_name (str): The name of the MIDI output port.
+            data (tuple): Raw message bytes.
+        """
+        writer = cls._get_raw_writer(port_name)
+        if writer:
+            t_call = _perf_ns() if cls._stats_enabled else 0
+            try:
+                writer(data)
+            except Exception as e:
+                if t_call:
+                    cls._stats_for(port_name).errors += 1
+                print(f"Error sending real-time message: {e}")
+                return
+            if t_call:
+                cls._record_sent(port_name, t_call)
+
+    @classmethod
+    def enable_stats(cls, enabled=True, dump_interval=None):
+        """Enable or disable per-port send statistics.
+
+        Args:
+            enabled (bool): Whether to record counters and latency histograms.
+            dump_interval (float): If given, print a stats summary to the log
+                every dump_interval seconds while enabled.
+        """
+        cls._stop_stats_dump()
+        cls._stats_enabled = bool(enabled)
+        if enabled and dump_interval:
+            cls._stats_dump_stop.clear()
+            cls._stats_dump_thread = threading.Thread(
+                target=cls._stats_dump_loop, args=(float(dump_interval),), name="MidiStatsDump", daemon=True
+            )
+            cls._stats_dump_thread.start()
+
+    @classmethod
+    def get_stats(cls):
+        """Return per-port counters and latency histograms as plain dicts.
+
+        Counters for drops (background queue full) and suppressed sends (port
+        backing off) are always tracked; the rest only while stats are enabled.
+        """
+        with cls._stats_lock:
+            stats = {name: port_stats.to_dict() for name, port_stats in cls._port_stats.items()}
+        for port_name in set(cls._dropped_messages) | set(cls._suppressed_sends):
+            entry = stats.setdefault(port_name, PortStats().to_dict())
+            entry["drops"] = cls.get_dropped_count(port_name)
+            entry["suppressed"] = cls.get_suppressed_count(port_name)
+        for entry in stats.values():
+            entry.setdefault("drops", 0)
+            entry.setdefault("suppressed", 0)
+        return stats
+
+    @classmethod
+    def reset_stats(cls):
+        """Clear all recorded statistics."""
+        with cls._stats_lock:
+            cls._port_stats = {}
+        cls._dropped_messages.clear()
+        cls._suppressed_sends.clear()
+
+    @classmethod
+    def _stats_for(cls, port_name):
+        stats = cls._port_stats.get(port_name)
+        if stats is None:
+            with cls._stats_lock:
+                stats = cls._port_stats.setdefault(port_name, PortStats())
+        return stats
+
+    @classmethod
+    def _record_sent(cls, port_name, t_start, count=1):
+        stats = cls._port_stats.get(port_name) or cls._stats_for(port_name)
+        stats.sent += count
+        stats.wire_latency.record(_perf_ns() - t_start)
+
+    @classmethod
+    def _stats_dump_loop(cls, interval):
+        while not cls._stats_dump_stop.wait(interval):
+            for port_name, entry in cls.get_stats().items():
+                wire = entry["wire_latency"]
+                print(
+                    f"MIDI stats '{port_name}': sent={entry['sent']} errors={entry['errors']} "
+                    f"drops={entry['drops']} suppressed={entry['suppressed']} reopens={entry['reopens']} "
+                    f"wire p50={wire['p50_us']:.1f}us p99={wire['p99_us']:.1f}us max={wire['max_us']:.1f}us"
+                )
+
+    @classmethod
+    def _stop_stats_dump(cls):
+        cls._stats_dump_stop.set()
+        thread = cls._stats_dump_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(1.0)
+        cls._stats_dump_thread = None
+
+    @classmethod
+    def send_batch(cls, port_name, messages, concatenate=False):
+        """Send several messages back-to-back, resolving the port only once.
+
+        Args:
+            port_name (str): The name of the MIDI output port.
+            messages: Iterable of raw message bytes (e.g. MessageTemplate.data)
+                or mido.Message objects.
+            concatenate (bool): Write all messages as a single buffer. Only use this
+                with backends that accept several messages per write (e.g. JACK);
+                the ALSA sequencer encodes one event per write.
+        """
+        t_call = _perf_ns() if cls._stats_enabled else 0
+        batch = [m.bytes() if isinstance(m, mido.Message) else m for m in messages]
+        if not batch:
+            return
+        ccs = [data for data in batch if len(data) == 3 and data[0] & 0xF0 == 0xB0]
+        count = len(batch)
+        if concatenate:
+            batch = [tuple(byte for message in batch for byte in message)]
+        if cls._write_batch(port_name, batch, count, t_call):
+            for data in ccs:
+                cls._record_cc(port_name, data)
+
+    @classmethod
+    def _write_batch(cls, port_name, batch, count, t_call):
+        """Write a list of raw messages back-to-back; count is the number of messages in it.
+
+        Returns:
+            bool: True if the messages were written (or queued). On failure the
+            port's last sent values are forgotten.
+        """
+        if cls._async_dispatch:
+            # Queued as one item so nothing is interleaved between the messages
+            return bool(port_name) and cls._enqueue(port_name, batch, t_call, batch=count)
+
+        writer = cls._get_raw_writer(port_name)
+        if not writer:
+            cls.clear_last_sent(port_name)
+            return False
+        try:
+            for data in batch:
+                writer(data)
+        except Exception as e:
+            if t_call:
+                cls._stats_for(port_name).errors += 1
+            print(f"Error sending message batch: {e}")
+            cls.clear_last_sent(port_name)
+            return False
+        if t_call:
+            cls._record_sent(port_name, t_call, count)
+        return True
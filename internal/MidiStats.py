@@ -0,0 +1,88 @@
+"""
+MidiStats - Low-overhead send counters and latency histograms.
+"""
+
+# Bucket i counts latencies below 2**i units of 1024 ns (~1 us); the last bucket is open-ended.
+BUCKET_COUNT = 24
+_UNIT_SHIFT = 10
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram with power-of-two bucket bounds.
+
+    Recording is a shift, a bit_length() and a list increment, so it stays far
+    below a microsecond per sample.
+    """
+
+    __slots__ = ("counts", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns):
+        index = (ns >> _UNIT_SHIFT).bit_length()
+        self.counts[index if index < BUCKET_COUNT else BUCKET_COUNT - 1] += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    @staticmethod
+    def bucket_upper_us(index):
+        """Upper bound of a bucket in microseconds (None for the open-ended last bucket)."""
+        if index >= BUCKET_COUNT - 1:
+            return None
+        return ((1 << index) << _UNIT_SHIFT) / 1000
+
+    def percentile_us(self, fraction):
+        """Approximate percentile: the upper bound of the bucket containing it."""
+        total = sum(self.counts)
+        if not total:
+            return 0.0
+        threshold = fraction * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                upper = self.bucket_upper_us(index)
+                return upper if upper is not None else self.max_ns / 1000
+        return self.max_ns / 1000
+
+    def to_dict(self):
+        count = sum(self.counts)
+        return {
+            "count": count,
+            "mean_us": (self.total_ns / count / 1000) if count else 0.0,
+            "p50_us": self.percentile_us(0.50),
+            "p99_us": self.percentile_us(0.99),
+            "max_us": self.max_ns / 1000,
+            "buckets": [
+                (self.bucket_upper_us(i), c) for i, c in enumerate(self.counts) if c
+            ],
+        }
+
+
+class PortStats:
+    """Counters and latency histograms for one output port."""
+
+    __slots__ = ("sent", "errors", "opens", "reopens", "enqueue_latency", "wire_latency")
+
+    def __init__(self):
+        self.sent = 0
+        self.errors = 0
+        self.opens = 0
+        self.reopens = 0
+        # Time from the send call to the message being queued (background dispatch only)
+        self.enqueue_latency = LatencyHistogram()
+        # Time from queueing (or the send call, when synchronous) to the port write returning
+        self.wire_latency = LatencyHistogram()
+
+    def to_dict(self):
+        return {
+            "sent": self.sent,
+            "errors": self.errors,
+            "reopens": self.reopens,
+            "enqueue_latency": self.enqueue_latency.to_dict(),
+            "wire_latency": self.wire_latency.to_dict(),
+        }
@@ -0,0 +1,112 @@
+"""
+MidiTemplate - Precompiled MIDI messages for the raw-bytes send path.
+"""
+
+STATUS_BYTES = {
+    "note_off": 0x80,
+    "note_on": 0x90,
+    "control_change": 0xB0,
+    "program_change": 0xC0,
+    "pitchwheel": 0xE0,
+}
+
+
+class MessageTemplate:
+    """A MIDI message validated once and stored as raw bytes.
+
+    `data` can be passed straight to MidiManager.send_raw. For three-byte
+    messages, with_value() swaps the last data byte (e.g. a CC value) without
+    re-validating the rest of the message.
+    """
+
+    __slots__ = ("msg_type", "data")
+
+    def __init__(self, msg_type, data):
+        self.msg_type = msg_type
+        self.data = data
+
+    def with_value(self, value):
+        """Return the message bytes with the last data byte replaced by value (0-127)."""
+        data = self.data
+        return (data[0], data[1], int(value) & 0x7F)
+
+    def __repr__(self):
+        return f"MessageTemplate({self.msg_type!r}, {self.data!r})"
+
+
+def _check_range(name, value, low, high):
+    value = int(value)
+    if not low <= value <= high:
+        raise ValueError(f"{name} must be in range {low}..{high}, got {value}")
+    return value
+
+
+def compile_message(msg_type, channel, data1=0, data2=0):
+    """Validate a message and compile it into a MessageTemplate.
+
+    Args:
+        msg_type (str): 'note_on', 'note_off', 'control_change', 'program_change' or 'pitchwheel'.
+        channel (int): The MIDI channel (0-15).
+        data1 (int): Note, control or program number, or the pitch (-8192 to 8191).
+        data2 (int): Velocity or control value. Ignored for program change and pitch wheel.
+
+    Raises:
+        ValueError: If the message type is unknown or a value is out of range.
+    """
+    if msg_type not in STATUS_BYTES:
+        raise ValueError(f"Unsupported message type: {msg_type}")
+    status = STATUS_BYTES[msg_type] | _check_range("channel", channel, 0, 15)
+
+    if msg_type == "pitchwheel":
+        pitch = _check_range("pitch", data1, -8192, 8191) + 8192
+        data = (status, pitch & 0x7F, pitch >> 7)
+    elif msg_type == "program_change":
+        data = (status, _check_range("program", data1, 0, 127))
+    else:
+        data = (status, _check_range("data1", data1, 0, 127), _check_range("data2", data2, 0, 127))
+    return MessageTemplate(msg_type, data)
+
+
+# Controller numbers used by the high-resolution modes
+CC_LSB_OFFSET = 32
+CC_DATA_ENTRY_MSB = 6
+CC_DATA_ENTRY_LSB = 38
+CC_NRPN_LSB, CC_NRPN_MSB = 98, 99
+CC_RPN_LSB, CC_RPN_MSB = 100, 101
+
+HIGH_RES_MODES = ("14bit", "nrpn", "rpn")
+HIGH_RES_MAX = 0x3FFF
+
+
+class HighResEncoder:
+    """Describes how 14-bit values (0-16383) are sent as Control Change messages.
+
+    Modes:
+        '14bit': MSB on CC n (0-31) and LSB on CC n+32.
+        'nrpn' / 'rpn': parameter select (CC 99/98 or 101/100) followed by
+            Data Entry MSB/LSB (CC 6/38).
+
+    The encoder itself is stateless. What the receiver last got is tracked per
+    port and channel by MidiManager.send_high_res, which sends only the select,
+    MSB and LSB messages the receiver is missing.
+    """
+
+    __slots__ = ("mode", "status", "number", "select", "msb_cc", "lsb_cc")
+
+    def __init__(self, mode, channel, number):
+        if mode not in HIGH_RES_MODES:
+            raise ValueError(f"Unsupported high-resolution mode: {mode}")
+        self.mode = mode
+        self.status = STATUS_BYTES["control_change"] | _check_range("channel", channel, 0, 15)
+        if mode == "14bit":
+            self.number = _check_range("control", number, 0, 31)
+            self.select = ()
+            self.msb_cc, self.lsb_cc = self.number, self.number + CC_LSB_OFFSET
+        else:
+            self.number = _check_range("parameter", number, 0, HIGH_RES_MAX)
+            msb_select, lsb_select = (CC_NRPN_MSB, CC_NRPN_LSB) if mode == "nrpn" else (CC_RPN_MSB, CC_RPN_LSB)
+            self.select = (
+                (self.status, msb_select, self.number >> 7),
+                (self.status, lsb_select, self.number & 0x7F),
+            )
+            self.msb_cc, self.lsb_cc = CC_DATA_ENTRY_MSB, CC_DATA_ENTRY_LSB
@@ -0,0 +1,38 @@
+"""
+PortWatch - Hot-plug handling shared by the MIDI actions.
+"""
+
+
+class PortWatchMixin:
+    """Keeps an action subscribed to the availability of its configured port.
+
+    Mix in before ActionBase. The action sets self._midi_manager in __init__
+    and calls _watch_port() from on_ready and whenever the port setting
+    changes. Actions that need to react to reconnects or clean up more on
+    removal override _on_port_status / on_removed_from_cache and call super().
+    """
+
+    _watched_port = None
+
+    def _watch_port(self, port_name) -> None:
+        """Subscribe to hot-plug notifications for the configured port."""
+        if not self._midi_manager:
+            return
+        if self._watched_port and self._watched_port != port_name:
+            self._midi_manager.unwatch_port(self._watched_port, self._on_port_status)
+        self._watched_port = port_name or None
+        if port_name:
+            available = self._midi_manager.watch_port(port_name, self._on_port_status)
+            self._on_port_status(port_name, available)
+
+    def _on_port_status(self, port_name, available) -> None:
+        """Show an error state while the configured port is disconnected."""
+        if available:
+            self.hide_error()
+        else:
+            self.show_error()
+
+    def on_removed_from_cache(self) -> None:
+        """Release the port reference so unused ports can be closed."""
+        self._watch_port(None)
+        super().on_removed_from_cache()
@@ -0,0 +1,107 @@
+"""
+Scheduler - Shared monotonic-clock scheduler for timed MIDI output.
+"""
+import heapq
+import itertools
+import threading
+import time
+
+
+class ScheduledCall:
+    """Handle for a scheduled callback; pass it to Scheduler.cancel()."""
+
+    __slots__ = ("deadline", "callback", "cancelled", "ran")
+
+    def __init__(self, deadline, callback):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+        self.ran = False
+
+
+class Scheduler:
+    """Runs callbacks at absolute time.monotonic() deadlines on one shared thread.
+
+    The thread sleeps until shortly before the next deadline and spins for the
+    final stretch, yielding the GIL on every turn, which gives sub-millisecond
+    accuracy without a thread per running sequence and without holding up the
+    UI or other senders. Callbacks run on the scheduler thread
+    and must be short, e.g. a MidiManager.send_raw call.
+    """
+
+    # How long before a deadline to stop sleeping and start spinning
+    SPIN_MARGIN = 0.0005
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Return the shared scheduler, starting it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []
+        self._counter = itertools.count()
+        self._thread = threading.Thread(target=self._run, name="MidiScheduler", daemon=True)
+        self._thread.start()
+
+    def schedule_at(self, deadline, callback):
+        """Run callback() at the given time.monotonic() deadline."""
+        call = ScheduledCall(deadline, callback)
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), call))
+            if self._heap[0][2] is call:
+                self._cond.notify()
+        return call
+
+    def schedule_in(self, delay, callback):
+        """Run callback() after delay seconds."""
+        return self.schedule_at(time.monotonic() + delay, callback)
+
+    def cancel(self, call):
+        """Cancel a scheduled call. Cancelling a call that already ran is a no-op.
+
+        Returns:
+            bool: True if the call had already run (or was about to).
+        """
+        with self._cond:
+            call.cancelled = True
+            return call.ran
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline = self._heap[0][0]
+                remaining = deadline - time.monotonic()
+                if remaining > self.SPIN_MARGIN:
+                    self._cond.wait(remaining - self.SPIN_MARGIN)
+                    continue
+
+            # Spin outside the lock so callers can keep scheduling meanwhile;
+            # sleep(0) releases the GIL so other threads are not held up
+            while time.monotonic() < deadline:
+                time.sleep(0)
+
+            with self._cond:
+                due = []
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    call = heapq.heappop(self._heap)[2]
+                    if not call.cancelled:
+                        call.ran = True
+                        due.append(call)
+            for call in due:
+                try:
+                    call.callback()
+                except Exception as e:
+                    print(f"Error in scheduled MIDI call: {e}")
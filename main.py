@@ -1,17 +1,47 @@
+import os
+
 from src.backend.PluginManager.PluginBase import PluginBase
 from src.backend.PluginManager.ActionHolder import ActionHolder
 from src.backend.PluginManager.ActionInputSupport import ActionInputSupport
 from src.backend.DeckManagement.InputIdentifier import Input
+from src.Signals import Signals
 
+from .internal.MidiManager import MidiManager
+from .internal.MidiClock import MidiClock
 from .actions.SendNote.SendNote import SendNote
 from .actions.SendMidiCommand.SendMidiCommand import SendMidiCommand
 from .actions.MidiDial.MidiDial import MidiDial
+from .actions.SendSequence.SendSequence import SendSequence
+from .actions.SendClock.SendClock import SendClock
+
+
+def _env_flag(name, default=False):
+    """Read an on/off option such as MIDI_PLUGIN_ASYNC_DISPATCH=1 from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_number(name, default):
+    """Read a numeric option from the environment, keeping the default if it is not a number."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        print(f"Ignoring invalid {name}: {os.environ[name]!r}")
+        return default
 
 
 class MidiPlugin(PluginBase):
     def __init__(self):
         super().__init__()
 
+        # One MIDI service shared by every action instance
+        self.midi_manager = MidiManager
+        MidiManager.initialize()
+        self._configure_from_environment()
+        self._connect_quit_signal()
+
         # Register one basic action
         self.send_note_holder = ActionHolder(
             plugin_base=self,
@@ -54,6 +84,34 @@ class MidiPlugin(PluginBase):
         )
         self.add_action_holder(self.midi_dial_holder)
 
+        # Register timed sequence action
+        self.send_sequence_holder = ActionHolder(
+            plugin_base=self,
+            action_base=SendSequence,
+            action_id="com_github_pkern90_midi::SendSequence",
+            action_name="Send MIDI Sequence",
+            action_support={
+                Input.Key: ActionInputSupport.SUPPORTED,
+                Input.Dial: ActionInputSupport.UNSUPPORTED,
+                Input.Touchscreen: ActionInputSupport.UNSUPPORTED,
+            }
+        )
+        self.add_action_holder(self.send_sequence_holder)
+
+        # Register MIDI clock action
+        self.send_clock_holder = ActionHolder(
+            plugin_base=self,
+            action_base=SendClock,
+            action_id="com_github_pkern90_midi::SendClock",
+            action_name="MIDI Clock",
+            action_support={
+                Input.Key: ActionInputSupport.SUPPORTED,
+                Input.Dial: ActionInputSupport.UNSUPPORTED,
+                Input.Touchscreen: ActionInputSupport.UNSUPPORTED,
+            }
+        )
+        self.add_action_holder(self.send_clock_holder)
+
         # Register plugin
         self.register(
             plugin_name="MIDI",
@@ -61,3 +119,27 @@ class MidiPlugin(PluginBase):
             plugin_version="1.1.0",
             app_version="1.5.0-beta"
         )
+
+    def _configure_from_environment(self):
+        """Apply the opt-in MidiManager options, see "Advanced options" in the README."""
+        if _env_flag("MIDI_PLUGIN_ASYNC_DISPATCH"):
+            MidiManager.set_async_dispatch(True, queue_size=int(_env_number("MIDI_PLUGIN_QUEUE_SIZE", 256)))
+        if not _env_flag("MIDI_PLUGIN_DEDUPE", default=True):
+            MidiManager.set_dedupe(False)
+        if _env_flag("MIDI_PLUGIN_STATS"):
+            MidiManager.enable_stats(True, dump_interval=_env_number("MIDI_PLUGIN_STATS_INTERVAL", 60) or None)
+
+    def _connect_quit_signal(self):
+        """Send everything that is still pending before the app quits."""
+        signal = getattr(Signals, "AppQuit", None)
+        if signal is None:
+            return
+        try:
+            self.connect(signal=signal, callback=self._on_app_quit)
+        except Exception as e:
+            print(f"Failed to connect AppQuit: {e}")
+
+    def _on_app_quit(self, *args, **kwargs):
+        # Clocks send Stop, so they go before the ports are closed
+        MidiClock.stop_all()
+        self.midi_manager.close_all_ports()